@@ -19,7 +19,7 @@ import math
 import random
 import time as _time
 import contextlib
-from collections import ChainMap, deque
+from collections import ChainMap, OrderedDict, deque
 from datetime import datetime as _datetime
 
 
@@ -346,9 +346,14 @@ _PRIMARY_TOKENS = frozenset({'NUMBER', 'STRING', 'FSTRING', 'LPAREN'})
 _TYPE_KEYWORDS = frozenset({'int', 'float', 'bool', 'string'})
 
 def debug(msg):
-    """Print debug message only when DEBUG mode is enabled."""
+    """Print debug message only when DEBUG mode is enabled.
+
+    Writes straight to the current ``sys.stdout`` rather than through
+    ``print()``: a ``--debug`` run emits a line per token and per node, and
+    the messages must stay interleaved with the program's own output.
+    """
     if DEBUG:
-        print(msg)
+        sys.stdout.write(f"{msg}\n")
 
 # Define token specifications with indentation tokens
 # NOTE: Order matters! Longer patterns (e.g. '==') must come before shorter
@@ -358,34 +363,31 @@ token_specification = [
     ('NUMBER',   r'\d+(\.\d*)?'),  # Integer or decimal number
     ('FSTRING',  r'f\"(?:[^\"\\]|\\.)*\"'),  # F-string literal (interpolated string)
     ('STRING',   r'\"(?:[^\"\\]|\\.)*\"'),  # String literal (with escape support)
-    ('EQ',       r'=='),  # Equality operator (must precede ASSIGN)
-    ('NEQ',      r'!='),  # Not-equal operator
-    ('LTE',      r'<='),  # Less-than-or-equal
-    ('GTE',      r'>='),  # Greater-than-or-equal
-    ('LT',       r'<'),   # Less-than
-    ('GT',       r'>'),   # Greater-than
-    ('ASSIGN',   r'='),  # Assignment operator
-    ('ARROW',    r'->'),  # Arrow operator (for lambda expressions)
-    ('PIPE',     r'\|>'),  # Pipe operator (must precede any | token)
-    ('BAR',      r'\|'),   # Bar (for match case alternatives)
-    ('OP',       r'[+\-*/%]'),  # Arithmetic operators (includes modulo)
-    ('LPAREN',   r'\('),  # Left parenthesis
-    ('RPAREN',   r'\)'),  # Right parenthesis
-    ('LBRACKET', r'\['),  # Left bracket
-    ('RBRACKET', r'\]'),  # Right bracket
-    ('LBRACE',   r'\{'),  # Left brace (for maps)
-    ('RBRACE',   r'\}'),  # Right brace (for maps)
-    ('COLON',    r':'),   # Colon (for map key-value pairs)
-    ('COMMA',    r','),   # Comma separator
-    ('DOT',      r'\.'),  # Dot accessor (for enum variants)
+    # Operators and punctuation share one alternative; _PUNCT_TYPES maps the
+    # matched text back to its token type.  Two-character operators come
+    # first so '==' is never split into two ASSIGNs and '->' / '|>' win over
+    # '-' / '|'.
+    ('PUNCT',    r'==|!=|<=|>=|->|\|>|[<>=|+\-*/%()\[\]{}:,.]'),
     ('IDENT',    r'[a-zA-Z_]\w*'),  # Identifiers (keywords resolved via _KEYWORDS post-match)
-    ('NEWLINE',  r'\n'),  # Newlines
-    ('SKIP',     r'[ \t]+'),  # Whitespace
-    ('MISMATCH', r'.'),  # Any other character
+    ('NEWLINE',  r'\n[ \t]*'),  # Newline plus the next line's indentation
+    ('MISMATCH', r'[^ \t\n]'),  # Any other character
 ]
 
-tok_regex = re.compile('|'.join(f'(?P<{pair[0]}>{pair[1]})' for pair in token_specification))
-_indent_re = re.compile(r'[ \t]*')
+# Token type for each operator / punctuation string matched by PUNCT.
+_PUNCT_TYPES = {
+    '==': 'EQ', '!=': 'NEQ', '<=': 'LTE', '>=': 'GTE', '<': 'LT', '>': 'GT',
+    '=': 'ASSIGN', '->': 'ARROW', '|>': 'PIPE', '|': 'BAR',
+    '+': 'OP', '-': 'OP', '*': 'OP', '/': 'OP', '%': 'OP',
+    '(': 'LPAREN', ')': 'RPAREN', '[': 'LBRACKET', ']': 'RBRACKET',
+    '{': 'LBRACE', '}': 'RBRACE', ':': 'COLON', ',': 'COMMA', '.': 'DOT',
+}
+
+# Spaces and tabs between tokens are consumed by the same match as the
+# token that follows them (before the named group), so the scanner never
+# hands back a whitespace-only match just to have it discarded.
+tok_regex = re.compile(r'[ \t]*(?:'
+                       + '|'.join(f'(?P<{pair[0]}>{pair[1]})' for pair in token_specification)
+                       + ')')
 
 # Keyword set for O(1) post-match reclassification.
 # Replacing the 30+ alternation KEYWORD regex pattern with a frozenset lookup
@@ -399,6 +401,20 @@ _KEYWORDS = frozenset({
     'match', 'case', 'enum', 'break', 'continue', 'assert', 'yield', 'next',
 })
 
+# Token types and keyword values are emitted as interned strings so the
+# parser's many ``== 'NEWLINE'`` / ``== 'function'`` checks against literals
+# succeed on the identity fast path instead of comparing characters.
+# Group names on a compiled pattern are not interned, hence the table
+# indexed by ``match.lastindex``.
+_GROUP_TOKEN_TYPES = [None] * (tok_regex.groups + 1)
+for _name, _index in tok_regex.groupindex.items():
+    _GROUP_TOKEN_TYPES[_index] = sys.intern(_name)
+del _name, _index
+_KEYWORD_VALUES = {kw: sys.intern(kw) for kw in _KEYWORDS}
+
+# An f-string interpolation that is exactly one IDENT token.
+_FSTRING_NAME_RE = re.compile(r'[a-zA-Z_]\w*')
+
 # Escape sequence mapping for string literals
 _ESCAPE_MAP = {
     'n': '\n',
@@ -460,95 +476,136 @@ def process_escapes(s):
             i += 1
     return ''.join(result)
 
-def tokenize(code):
-    """Tokenize sauravcode source into a list of (type, value, line) tuples.
+def iter_tokens(code):
+    """Yield sauravcode tokens one at a time as (type, value, line, col) tuples.
 
-    Handles indentation-based block structure by emitting INDENT/DEDENT
-    tokens, similar to Python's tokenizer. Comments and whitespace are
-    consumed but not emitted. Returns a flat token list ready for parsing.
+    This is the streaming form of ``tokenize()``: tokens are produced as the
+    scanner reaches them, so callers that consume the stream once never hold
+    more than the current token.  INDENT/DEDENT bookkeeping and the merging
+    of ``else`` followed by ``if`` into a single ``else if`` keyword happen
+    inside the generator.
 
     Args:
         code: Source code string to tokenize.
 
-    Returns:
-        List of (token_type, token_value, line_number) tuples.
+    Yields:
+        (token_type, token_value, line_number, column) tuples.
     """
     if DEBUG:
         debug("Tokenizing code...")
-    tokens = []
     line_num = 1
     line_start = 0
     indent_levels = [0]  # Track indentation levels
-    
+    # An 'else' keyword is held back for one token so that a directly
+    # following 'if' can be merged into 'else if' (parser compatibility).
+    pending_else = None
+
+    # Branches are ordered by how often each match type occurs in real
+    # programs: comments are dropped before their text is even extracted,
+    # then identifiers and punctuation, with NEWLINE's indentation
+    # bookkeeping after those.  Each match may start with whitespace, so
+    # text and positions are read from the token's own group.
     for match in tok_regex.finditer(code):
-        typ = match.lastgroup
-        value = match.group(typ)
+        index = match.lastindex
+        typ = _GROUP_TOKEN_TYPES[index]
+        if typ == 'COMMENT':
+            continue
+        value = match.group(index)
         if DEBUG:
             debug(f"Token: {typ}, Value: {repr(value)}")
 
-        if typ == 'NEWLINE':
+        if typ == 'IDENT':
+            # Reclassify identifiers that are keywords via O(1) set lookup.
+            # This replaces the expensive 30+ alternation KEYWORD regex;
+            # only IDENT matches can be keywords, so other tokens skip it.
+            keyword = _KEYWORD_VALUES.get(value)
+            if keyword is not None:
+                typ = 'KEYWORD'
+                value = keyword
+            else:
+                # Every occurrence of a name shares one string, so scope
+                # lookups keyed by it hit dict's identity check.
+                value = sys.intern(value)
+        elif typ == 'PUNCT':
+            typ = _PUNCT_TYPES[value]
+        elif typ == 'NEWLINE':
+            if pending_else is not None:
+                yield pending_else
+                pending_else = None
+            # The NEWLINE pattern also consumes the next line's leading
+            # whitespace, so the indentation is read straight from the match
+            # instead of re-scanning the source at line_start.
+            newline_pos = match.start(index)
             line_num += 1
-            line_start = match.end()
-            tokens.append(('NEWLINE', value, line_num, match.start()))
-            
-            # Handle indentation on the next line
-            indent_match = _indent_re.match(code, line_start)
-            if indent_match:
-                indent_str = indent_match.group(0)
-                indent = len(indent_str.replace('\t', '    '))  # Normalize tabs to spaces
+            line_start = newline_pos + 1
+            yield ('NEWLINE', '\n', line_num, newline_pos)
+
+            # A tab counts as four spaces.  Indentation is nearly always
+            # spaces only, so the width is the match length minus the
+            # newline, with no tab-expanded copy built just to measure it.
+            indent = len(value) - 1
+            if '\t' in value:
+                indent += 3 * value.count('\t')
+            if DEBUG:
+                debug(f"Detected indentation: {indent} spaces")
+            if indent > indent_levels[-1]:
+                indent_levels.append(indent)
+                yield ('INDENT', indent, line_num, line_start)
                 if DEBUG:
-                    debug(f"Detected indentation: {indent} spaces")
-                if indent > indent_levels[-1]:
-                    indent_levels.append(indent)
-                    tokens.append(('INDENT', indent, line_num, line_start))
-                    if DEBUG:
-                        debug(f"Added INDENT token: {indent}")
-                while indent < indent_levels[-1]:
-                    popped_indent = indent_levels.pop()
-                    tokens.append(('DEDENT', popped_indent, line_num, line_start))
-                    if DEBUG:
-                        debug(f"Added DEDENT token: {popped_indent}")
-    
-        elif typ in ('SKIP', 'COMMENT'):
+                    debug(f"Added INDENT token: {indent}")
+            while indent < indent_levels[-1]:
+                popped_indent = indent_levels.pop()
+                yield ('DEDENT', popped_indent, line_num, line_start)
+                if DEBUG:
+                    debug(f"Added DEDENT token: {popped_indent}")
             continue
         elif typ == 'MISMATCH':
             raise RuntimeError(f'Unexpected character {value!r} on line {line_num}')
-        else:
-            # Reclassify identifiers that are keywords via O(1) set lookup.
-            # This replaces the expensive 30+ alternation KEYWORD regex.
-            if value in _KEYWORDS:
-                typ = 'KEYWORD'
-            column = match.start() - line_start
-            tokens.append((typ, value, line_num, column))
-            if DEBUG:
-                debug(f"Added token: ({typ}, {value}, {line_num}, {column})")
-    
+
+        column = match.start(index) - line_start
+        if pending_else is not None:
+            if typ == 'KEYWORD' and value == 'if':
+                yield ('KEYWORD', 'else if', pending_else[2], pending_else[3])
+                pending_else = None
+                continue
+            yield pending_else
+            pending_else = None
+        if typ == 'KEYWORD' and value == 'else':
+            pending_else = (typ, value, line_num, column)
+            continue
+        yield (typ, value, line_num, column)
+        if DEBUG:
+            debug(f"Added token: ({typ}, {value}, {line_num}, {column})")
+
+    if pending_else is not None:
+        yield pending_else
+
     # Final dedents at end of file
     while len(indent_levels) > 1:
         popped_indent = indent_levels.pop()
-        tokens.append(('DEDENT', popped_indent, line_num, line_start))
+        yield ('DEDENT', popped_indent, line_num, line_start)
         if DEBUG:
             debug(f"Added final DEDENT token: {popped_indent}")
 
-    # Merge adjacent KEYWORD('else') + KEYWORD('if') into KEYWORD('else if')
-    # to preserve parser compatibility.  This is a single linear pass.
-    merged = []
-    i = 0
-    n = len(tokens)
-    while i < n:
-        tok = tokens[i]
-        if (tok[0] == 'KEYWORD' and tok[1] == 'else' and
-                i + 1 < n and tokens[i + 1][0] == 'KEYWORD' and tokens[i + 1][1] == 'if'):
-            merged.append(('KEYWORD', 'else if', tok[2], tok[3]))
-            i += 2
-        else:
-            merged.append(tok)
-            i += 1
-    tokens = merged
-    
     if DEBUG:
         debug("Finished tokenizing.\n")
-    return tokens
+
+
+def tokenize(code):
+    """Tokenize sauravcode source into a list of (type, value, line) tuples.
+
+    Handles indentation-based block structure by emitting INDENT/DEDENT
+    tokens, similar to Python's tokenizer. Comments and whitespace are
+    consumed but not emitted. Returns a flat token list ready for parsing;
+    see ``iter_tokens()`` for the streaming variant.
+
+    Args:
+        code: Source code string to tokenize.
+
+    Returns:
+        List of (token_type, token_value, line_number) tuples.
+    """
+    return list(iter_tokens(code))
 
 # AST Node Classes with __repr__ for Debugging
 class ASTNode:
@@ -557,12 +614,20 @@ class ASTNode:
     Every node in the parsed AST inherits from this class. The optional
     ``line_num`` attribute tracks the source line for error reporting
     and debugger integration.
+
+    Nodes use ``__slots__`` (no per-instance ``__dict__``), which keeps large
+    ASTs compact and makes attribute loads in the interpreter a fixed slot
+    offset.  Tools that walk nodes generically should use ``node_vars()``
+    instead of ``vars()``.
     """
-    line_num = None  # Source line number (optionally set by debugger/tooling)
+    __slots__ = ('line_num',)  # Source line number (optionally set by debugger/tooling)
 
 class AssignmentNode(ASTNode):
     """Variable assignment: ``name = expression``."""
+    __slots__ = ('name', 'expression')
+
     def __init__(self, name, expression):
+        self.line_num = None
         self.name = name
         self.expression = expression
 
@@ -571,10 +636,17 @@ class AssignmentNode(ASTNode):
 
 class FunctionNode(ASTNode):
     """Function definition: ``function name(params) body``."""
+    __slots__ = ('name', 'params', 'body', 'closure_scope', '_is_generator',
+                 '_kernel', '_memo', '_tail_call')
+
     def __init__(self, name, params, body):
+        self.line_num = None
         self.name = name
         self.params = params
         self.body = body
+        self._kernel = None     # numeric kernel: None = not tried yet, False = n/a
+        self._memo = None       # call memo: None = not tried yet, False = n/a
+        self._tail_call = None  # final self-call: None = not tried yet, False = n/a
 
     def __repr__(self):
         return f"FunctionNode(name={self.name}, params={self.params}, body={self.body})"
@@ -590,7 +662,7 @@ class _BoundFunction(FunctionNode):
     all attributes, and allocates a new dict).  On CPython 3.11+
     this is ~3x faster per function-as-value reference.
     """
-    __slots__ = ('_func', 'closure_scope', '_is_generator')
+    __slots__ = ('_func',)
 
     def __init__(self, func_node, closure_scope):
         # Skip FunctionNode.__init__ — copy attributes directly
@@ -599,12 +671,19 @@ class _BoundFunction(FunctionNode):
         self.body = func_node.body
         self._func = func_node
         self.closure_scope = closure_scope
+        self._kernel = None
+        self._memo = None
+        # Calls by name reach the unbound function, never this wrapper.
+        self._tail_call = False
         self._is_generator = getattr(func_node, '_is_generator', False)
         self.line_num = getattr(func_node, 'line_num', None)
 
 class ReturnNode(ASTNode):
     """Return statement: ``return expression``."""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
+        self.line_num = None
         self.expression = expression
 
     def __repr__(self):
@@ -612,25 +691,85 @@ class ReturnNode(ASTNode):
 
 class YieldNode(ASTNode):
     """Yield a value from a generator function."""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
+        self.line_num = None
         self.expression = expression
 
     def __repr__(self):
         return f"YieldNode(expression={self.expression})"
 
+def _safe_div(a, b):
+    if b == 0:
+        raise RuntimeError("Division by zero")
+    return a / b
+
+
+def _safe_mod(a, b):
+    if b == 0:
+        raise RuntimeError("Modulo by zero")
+    return a % b
+
+
+# Numeric implementation of each arithmetic operator, with inline
+# zero-checks for / and %.  +, -, * go straight to the C-level operator.
+_NUMERIC_BINARY_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _safe_div,
+    '%': _safe_mod,
+}
+
+# Operators whose non-numeric case (string and list concatenation,
+# set-like difference, ...) is the plain operator function, no guards.
+_GENERIC_BINARY_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+}
+
+# Implementation of each comparison operator, resolved onto CompareNode.
+_COMPARE_OPS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<':  operator.lt,
+    '>':  operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+
 class BinaryOpNode(ASTNode):
-    """Binary arithmetic operation: ``left operator right`` (+, -, *, /, %)."""
+    """Binary arithmetic operation: ``left operator right`` (+, -, *, /, %).
+
+    The numeric implementation of ``operator`` is resolved once, when the
+    node is built, so evaluating number-on-number arithmetic is a single
+    call instead of a dispatch-table lookup on every evaluation.  So is
+    the unguarded implementation for other operands (``_generic_op``),
+    where the operator has one.
+    """
+    __slots__ = ('left', 'operator', 'right', '_numeric_op', '_generic_op',
+                 '_kernel')
+
     def __init__(self, left, operator, right):
+        self.line_num = None
         self.left = left
         self.operator = operator
         self.right = right
+        self._numeric_op = _NUMERIC_BINARY_OPS.get(operator)
+        self._generic_op = _GENERIC_BINARY_OPS.get(operator)
+        self._kernel = None  # expression kernel: None = not tried yet, False = n/a
 
     def __repr__(self):
         return f"BinaryOpNode(left={self.left}, operator='{self.operator}', right={self.right})"
 
 class NumberNode(ASTNode):
     """Numeric literal (integer or float)."""
+    __slots__ = ('value',)
+
     def __init__(self, value):
+        self.line_num = None
         self.value = value
 
     def __repr__(self):
@@ -638,7 +777,10 @@ class NumberNode(ASTNode):
 
 class StringNode(ASTNode):
     """String literal with escape sequence support."""
+    __slots__ = ('value',)
+
     def __init__(self, value):
+        self.line_num = None
         self.value = value
 
     def __repr__(self):
@@ -646,7 +788,10 @@ class StringNode(ASTNode):
 
 class IdentifierNode(ASTNode):
     """Variable or function name reference."""
+    __slots__ = ('name',)
+
     def __init__(self, name):
+        self.line_num = None
         self.name = name
 
     def __repr__(self):
@@ -654,44 +799,76 @@ class IdentifierNode(ASTNode):
 
 class PrintNode(ASTNode):
     """Print statement: ``print expression``."""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
+        self.line_num = None
         self.expression = expression
 
     def __repr__(self):
         return f"PrintNode(expression={self.expression})"
 
 class FunctionCallNode(ASTNode):
-    """Function call: ``name(arguments)`` or built-in call."""
+    """Function call: ``name(arguments)`` or built-in call.
+
+    When every argument is a number, string or bool literal, their values
+    are collected once into ``_const_args`` so a call does not evaluate
+    the argument nodes again; otherwise ``_const_args`` is None.
+    """
+    __slots__ = ('name', 'arguments', '_const_args')
+
     def __init__(self, name, arguments):
+        self.line_num = None
         self.name = name
         self.arguments = arguments
+        literal_types = (NumberNode, StringNode, BoolNode)
+        if all(type(arg) in literal_types for arg in arguments):
+            self._const_args = tuple(arg.value for arg in arguments)
+        else:
+            self._const_args = None
 
     def __repr__(self):
         return f"FunctionCallNode(name={self.name}, arguments={self.arguments})"
 
 class CompareNode(ASTNode):
-    """Comparison: ==, !=, <, >, <=, >="""
+    """Comparison: ==, !=, <, >, <=, >=
+
+    Like BinaryOpNode, the operator function is resolved when the node is
+    built and kept as ``_compare_op``.
+    """
+    __slots__ = ('left', 'operator', 'right', '_compare_op', '_kernel')
+
     def __init__(self, left, operator, right):
+        self.line_num = None
         self.left = left
         self.operator = operator
         self.right = right
+        self._compare_op = _COMPARE_OPS.get(operator)
+        self._kernel = None  # expression kernel: None = not tried yet, False = n/a
 
     def __repr__(self):
         return f"CompareNode(left={self.left}, operator='{self.operator}', right={self.right})"
 
 class LogicalNode(ASTNode):
     """Logical: and, or"""
+    __slots__ = ('left', 'operator', 'right', '_kernel')
+
     def __init__(self, left, operator, right):
+        self.line_num = None
         self.left = left
         self.operator = operator
         self.right = right
+        self._kernel = None  # expression kernel: None = not tried yet, False = n/a
 
     def __repr__(self):
         return f"LogicalNode(left={self.left}, operator='{self.operator}', right={self.right})"
 
 class UnaryOpNode(ASTNode):
     """Unary: not, - (negation)"""
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator, operand):
+        self.line_num = None
         self.operator = operator
         self.operand = operand
 
@@ -700,7 +877,10 @@ class UnaryOpNode(ASTNode):
 
 class BoolNode(ASTNode):
     """Boolean literal: ``true`` or ``false``."""
+    __slots__ = ('value',)
+
     def __init__(self, value):
+        self.line_num = None
         self.value = value
 
     def __repr__(self):
@@ -708,7 +888,10 @@ class BoolNode(ASTNode):
 
 class IfNode(ASTNode):
     """Conditional: ``if condition body [else if ... else ...]``."""
+    __slots__ = ('condition', 'body', 'elif_chains', 'else_body')
+
     def __init__(self, condition, body, elif_chains=None, else_body=None):
+        self.line_num = None
         self.condition = condition
         self.body = body
         self.elif_chains = elif_chains or []
@@ -719,7 +902,10 @@ class IfNode(ASTNode):
 
 class WhileNode(ASTNode):
     """While loop: ``while condition body``."""
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
+        self.line_num = None
         self.condition = condition
         self.body = body
 
@@ -728,26 +914,37 @@ class WhileNode(ASTNode):
 
 class ForNode(ASTNode):
     """Range-based for loop: ``for var in start to end body``."""
+    __slots__ = ('var', 'start', 'end', 'body', '_kernel')
+
     def __init__(self, var, start, end, body):
+        self.line_num = None
         self.var = var
         self.start = start
         self.end = end
         self.body = body
+        self._kernel = None  # loop kernel: None = not tried yet, False = n/a
 
     def __repr__(self):
         return f"ForNode(var={self.var}, start={self.start}, end={self.end})"
 
 class ListNode(ASTNode):
     """List literal: ``[elem1, elem2, ...]``."""
+    __slots__ = ('elements', '_values')
+
     def __init__(self, elements):
+        self.line_num = None
         self.elements = elements
+        self._values = None  # literal element values: None = not tried yet, False = n/a
 
     def __repr__(self):
         return f"ListNode(elements={self.elements})"
 
 class IndexNode(ASTNode):
     """Index access: ``obj[index]``."""
+    __slots__ = ('obj', 'index')
+
     def __init__(self, obj, index):
+        self.line_num = None
         self.obj = obj
         self.index = index
 
@@ -756,7 +953,10 @@ class IndexNode(ASTNode):
 
 class AppendNode(ASTNode):
     """Append to a list: ``append(list_name, value)``."""
+    __slots__ = ('list_name', 'value')
+
     def __init__(self, list_name, value):
+        self.line_num = None
         self.list_name = list_name
         self.value = value
 
@@ -765,7 +965,10 @@ class AppendNode(ASTNode):
 
 class PopNode(ASTNode):
     """Pop from a list: ``pop(list_name)``."""
+    __slots__ = ('list_name',)
+
     def __init__(self, list_name):
+        self.line_num = None
         self.list_name = list_name
 
     def __repr__(self):
@@ -773,7 +976,10 @@ class PopNode(ASTNode):
 
 class LenNode(ASTNode):
     """Length of a collection or string: ``len(expression)``."""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
+        self.line_num = None
         self.expression = expression
 
     def __repr__(self):
@@ -781,7 +987,10 @@ class LenNode(ASTNode):
 
 class MapNode(ASTNode):
     """Map (dictionary) literal: ``{key: value, ...}``."""
+    __slots__ = ('pairs',)
+
     def __init__(self, pairs):
+        self.line_num = None
         self.pairs = pairs  # list of (key_expr, value_expr) tuples
 
     def __repr__(self):
@@ -793,7 +1002,10 @@ class FStringNode(ASTNode):
     Parts is a list of items — each is either a StringNode (literal text)
     or an expression node (to be evaluated and converted to string).
     """
+    __slots__ = ('parts',)
+
     def __init__(self, parts):
+        self.line_num = None
         self.parts = parts  # list of ASTNode (StringNode for literals, others for expressions)
 
     def __repr__(self):
@@ -801,7 +1013,10 @@ class FStringNode(ASTNode):
 
 class IndexedAssignmentNode(ASTNode):
     """Assignment to a collection element: list[index] = value, map[key] = value"""
+    __slots__ = ('name', 'index', 'value')
+
     def __init__(self, name, index, value):
+        self.line_num = None
         self.name = name
         self.index = index
         self.value = value
@@ -817,7 +1032,10 @@ class ForEachNode(ASTNode):
     
     Iterates over: lists (elements), strings (characters), maps (keys).
     """
+    __slots__ = ('var', 'iterable', 'body')
+
     def __init__(self, var, iterable, body):
+        self.line_num = None
         self.var = var          # variable name to bind each element
         self.iterable = iterable  # expression that evaluates to a collection
         self.body = body        # list of statements in loop body
@@ -833,7 +1051,10 @@ class TryCatchNode(ASTNode):
     catch error_var
         handler...
     """
+    __slots__ = ('body', 'error_var', 'handler')
+
     def __init__(self, body, error_var, handler):
+        self.line_num = None
         self.body = body         # list of statements in try block
         self.error_var = error_var  # variable name to bind error message (string)
         self.handler = handler   # list of statements in catch block
@@ -847,7 +1068,10 @@ class ThrowNode(ASTNode):
     throw "something went wrong"
     throw f"invalid value: {x}"
     """
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
+        self.line_num = None
         self.expression = expression  # expression that evaluates to the error message
 
     def __repr__(self):
@@ -863,7 +1087,10 @@ class LambdaNode(ASTNode):
     lambda x y -> x + y
     map (lambda x -> x * 2) [1, 2, 3]
     """
+    __slots__ = ('params', 'body_expr')
+
     def __init__(self, params, body_expr):
+        self.line_num = None
         self.params = params       # list of parameter names
         self.body_expr = body_expr  # single expression (not a block)
 
@@ -876,7 +1103,10 @@ class PipeNode(ASTNode):
     Evaluates value, then passes it as the last argument to function.
     Enables functional composition: x |> f |> g is equivalent to g(f(x)).
     """
+    __slots__ = ('value', 'function')
+
     def __init__(self, value, function):
+        self.line_num = None
         self.value = value       # Left side: expression to pipe
         self.function = function # Right side: function/lambda to apply
     
@@ -891,7 +1121,10 @@ class ImportNode(ASTNode):
     The .srv extension is added automatically if not present.
     Circular imports are detected and prevented.
     """
+    __slots__ = ('module_path',)
+
     def __init__(self, module_path):
+        self.line_num = None
         self.module_path = module_path  # string path to the module
 
     def __repr__(self):
@@ -904,7 +1137,10 @@ class ListComprehensionNode(ASTNode):
     Creates a new list by evaluating expr for each element of
     iterable, optionally filtering with a condition.
     """
+    __slots__ = ('expr', 'var', 'iterable', 'condition')
+
     def __init__(self, expr, var, iterable, condition=None):
+        self.line_num = None
         self.expr = expr       # expression to evaluate per element
         self.var = var         # loop variable name (string)
         self.iterable = iterable  # expression that produces the collection
@@ -916,7 +1152,10 @@ class ListComprehensionNode(ASTNode):
 
 class MatchNode(ASTNode):
     """Pattern matching: match expression with case clauses."""
+    __slots__ = ('expression', 'cases')
+
     def __init__(self, expression, cases):
+        self.line_num = None
         self.expression = expression
         self.cases = cases
 
@@ -925,7 +1164,10 @@ class MatchNode(ASTNode):
 
 class CaseNode(ASTNode):
     """A single case in a match expression."""
+    __slots__ = ('patterns', 'guard', 'body', 'is_wildcard', 'binding_name')
+
     def __init__(self, patterns, guard, body, is_wildcard=False, binding_name=None):
+        self.line_num = None
         self.patterns = patterns
         self.guard = guard
         self.body = body
@@ -942,7 +1184,10 @@ class EnumNode(ASTNode):
     integer value starting from 0. Access variants via dot notation:
     Color.RED (== 0), Color.GREEN (== 1), etc.
     """
+    __slots__ = ('name', 'variants')
+
     def __init__(self, name, variants):
+        self.line_num = None
         self.name = name
         self.variants = variants
 
@@ -951,7 +1196,10 @@ class EnumNode(ASTNode):
 
 class EnumAccessNode(ASTNode):
     """Access an enum variant: Color.RED"""
+    __slots__ = ('enum_name', 'variant_name')
+
     def __init__(self, enum_name, variant_name):
+        self.line_num = None
         self.enum_name = enum_name
         self.variant_name = variant_name
 
@@ -960,7 +1208,10 @@ class EnumAccessNode(ASTNode):
 
 class SliceNode(ASTNode):
     """Slice access: obj[start:end], obj[start:], obj[:end], obj[:]"""
+    __slots__ = ('obj', 'start', 'end')
+
     def __init__(self, obj, start, end):
+        self.line_num = None
         self.obj = obj
         self.start = start
         self.end = end
@@ -969,7 +1220,10 @@ class SliceNode(ASTNode):
 
 class AssertNode(ASTNode):
     """Assert that a condition is true, with optional error message."""
+    __slots__ = ('condition', 'message')
+
     def __init__(self, condition, message=None):
+        self.line_num = None
         self.condition = condition
         self.message = message
 
@@ -978,24 +1232,71 @@ class AssertNode(ASTNode):
 
 class BreakNode(ASTNode):
     """Break out of the nearest enclosing loop."""
+    __slots__ = ()
+
+    def __init__(self):
+        self.line_num = None
+
     def __repr__(self):
         return "BreakNode()"
 
 class ContinueNode(ASTNode):
     """Skip to the next iteration of the nearest enclosing loop."""
+    __slots__ = ()
+
+    def __init__(self):
+        self.line_num = None
+
     def __repr__(self):
         return "ContinueNode()"
 
 
 class TernaryNode(ASTNode):
     """Ternary conditional expression: true_expr if condition else false_expr"""
+    __slots__ = ('condition', 'true_expr', 'false_expr')
+
     def __init__(self, condition, true_expr, false_expr):
+        self.line_num = None
         self.condition = condition
         self.true_expr = true_expr
         self.false_expr = false_expr
     def __repr__(self):
         return f"TernaryNode({self.true_expr} if {self.condition} else {self.false_expr})"
 
+# Slot names per node class (walking the MRO once per class, not per node).
+_NODE_SLOTS = {}
+_UNSET_SLOT = object()  # node_vars() marker for a slot never assigned
+
+
+def node_vars(node):
+    """Return a dict of the attributes set on an AST node, like ``vars()``.
+
+    AST nodes are slot-based and have no ``__dict__``, so ``vars(node)``
+    raises ``TypeError``.  Unset slots (e.g. ``closure_scope`` on a
+    FunctionNode that was never imported) are omitted, matching what
+    ``vars()`` used to report.
+    """
+    cls = type(node)
+    names = _NODE_SLOTS.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in names:
+                    names.append(name)
+        names = tuple(names)
+        _NODE_SLOTS[cls] = names
+    result = dict(getattr(node, '__dict__', ()))
+    for name in names:
+        value = getattr(node, name, _UNSET_SLOT)
+        if value is not _UNSET_SLOT:
+            result[name] = value
+    return result
+
+
+# End-of-input sentinel appended to every Parser's token list.
+_EOF_TOKEN = ('EOF', None)
+
 # Parser Class with Block Parsing and Full Control Flow
 class Parser:
     """Recursive-descent parser for sauravcode.
@@ -1006,7 +1307,12 @@ class Parser:
     classes, control flow, pattern matching, enums, and comprehensions.
 
     Args:
-        tokens: List of (type, value, line) tuples from the tokenizer.
+        tokens: List of (type, value, line) tuples from the tokenizer, or
+            any iterable of them such as the ``iter_tokens()`` stream.
+
+    Alongside ``tokens`` the parser keeps ``token_types``, a parallel list of
+    just the type strings.  Most parse decisions only look at the type, so
+    they index that flat list instead of fetching and subscripting a tuple.
     """
     # Builtin function names that accept arguments.
     # When one of these is followed by '[', the '[' starts a list literal
@@ -1142,7 +1448,15 @@ class Parser:
     # direct method references initialised once in __init__.
 
     def __init__(self, tokens):
+        # The parser keeps its own token list (a token stream such as
+        # iter_tokens() is collected straight into it) terminated by an
+        # EOF sentinel, so peek()/peek_type() index without a bounds check.
+        # ``_end`` is the number of real tokens before the sentinel.
+        tokens = list(tokens)
+        self._end = len(tokens)
+        tokens.append(_EOF_TOKEN)
         self.tokens = tokens
+        self.token_types = [tok[0] for tok in tokens]
         self.pos = 0
         self._keyword_dispatch = {
             'function': self.parse_function,
@@ -1163,10 +1477,35 @@ class Parser:
             'break':    self._parse_break,
             'continue': self._parse_continue,
         }
+        # Non-keyword statement starts, keyed by token type.
+        self._statement_dispatch = {
+            'IDENT':   self._parse_ident_statement,
+            'NEWLINE': self._skip_token,
+            'INDENT':  self._skip_token,
+            'DEDENT':  self._skip_token,
+        }
+        # Atoms dispatch on the token type, and keyword atoms on the keyword.
+        self._atom_dispatch = {
+            'IDENT':    self._parse_ident_atom,
+            'NUMBER':   self._parse_number_atom,
+            'STRING':   self._parse_string_atom,
+            'FSTRING':  self._parse_fstring_atom,
+            'KEYWORD':  self._parse_keyword_atom,
+            'LPAREN':   self._parse_paren_atom,
+            'LBRACKET': self.parse_list_literal,
+            'LBRACE':   self.parse_map_literal,
+        }
+        self._atom_keyword_dispatch = {
+            'true':   self._parse_true_atom,
+            'false':  self._parse_false_atom,
+            'len':    self._parse_len_atom,
+            'pop':    self._parse_pop_atom,
+            'lambda': self.parse_lambda,
+        }
 
     def _current_line(self):
         """Return the line number of the current token, or None."""
-        if self.pos < len(self.tokens) and len(self.tokens[self.pos]) >= 3:
+        if self.pos < self._end and len(self.tokens[self.pos]) >= 3:
             return self.tokens[self.pos][2]
         return None
 
@@ -1181,9 +1520,9 @@ class Parser:
         if DEBUG:
             debug("Parsing tokens into AST...")
         statements = []
-        while self.pos < len(self.tokens):
+        while self.pos < self._end:
             self.skip_newlines()
-            if self.pos < len(self.tokens):
+            if self.pos < self._end:
                 statement = self.parse_statement()
                 if statement:  # Only add valid statements
                     statements.append(statement)
@@ -1224,7 +1563,9 @@ class Parser:
         return ContinueNode()
 
     def _parse_statement_inner(self):
-        token_type, value, *_ = self.peek()
+        tok = self.tokens[self.pos]
+        token_type = tok[0]
+        value = tok[1]
         if DEBUG:
             debug(f"Parsing statement: token_type={token_type}, value={repr(value)}")
 
@@ -1238,36 +1579,43 @@ class Parser:
                 self.advance()
                 return None
 
-        if token_type == 'IDENT':
-            name = self.expect('IDENT')[1]
-            if self.peek()[0] == 'ASSIGN':
-                self.expect('ASSIGN')
-                expression = self.parse_full_expression()
-                if DEBUG:
-                    debug(f"Parsed assignment: {name} = {expression}")
-                return AssignmentNode(name, expression)
-            elif self.peek()[0] == 'LBRACKET':
-                # list[index] or map[key] access — parse index
-                self.expect('LBRACKET')
-                idx = self.parse_full_expression()
-                self.expect('RBRACKET')
-                if self.peek()[0] == 'ASSIGN':
-                    self.expect('ASSIGN')
-                    val = self.parse_full_expression()
-                    return IndexedAssignmentNode(name, idx, val)
-                return IndexNode(IdentifierNode(name), idx)
-            else:
-                return self.parse_function_call(name)
-        elif token_type == 'NEWLINE':
-            self.advance()
-            return None
-        elif token_type in {'INDENT', 'DEDENT'}:
+        handler = self._statement_dispatch.get(token_type)
+        if handler is not None:
+            return handler()
+        raise SyntaxError(f"Unknown top-level statement: token_type={token_type}, value={repr(value)}")
+
+    def _parse_ident_statement(self):
+        """Parse a statement that starts with an identifier.
+
+        Covers ``name = expr``, ``name[idx] = expr``, a bare ``name[idx]``
+        expression and function calls such as ``greet "world"``.
+        """
+        name = self.expect('IDENT')[1]
+        if self.peek_type() == 'ASSIGN':
+            self.expect('ASSIGN')
+            expression = self.parse_full_expression()
             if DEBUG:
-                debug(f"Skipping unexpected {token_type} with value={value}")
-            self.advance()
-            return None
+                debug(f"Parsed assignment: {name} = {expression}")
+            return AssignmentNode(name, expression)
+        elif self.peek_type() == 'LBRACKET':
+            # list[index] or map[key] access — parse index
+            self.expect('LBRACKET')
+            idx = self.parse_full_expression()
+            self.expect('RBRACKET')
+            if self.peek_type() == 'ASSIGN':
+                self.expect('ASSIGN')
+                val = self.parse_full_expression()
+                return IndexedAssignmentNode(name, idx, val)
+            return IndexNode(IdentifierNode(name), idx)
         else:
-            raise SyntaxError(f"Unknown top-level statement: token_type={token_type}, value={repr(value)}")
+            return self.parse_function_call(name)
+
+    def _skip_token(self):
+        """Consume a NEWLINE or a stray INDENT/DEDENT; no statement results."""
+        token = self.advance()
+        if DEBUG and token[0] != 'NEWLINE':
+            debug(f"Skipping unexpected {token[0]} with value={token[1]}")
+        return None
 
     def parse_function(self):
         if DEBUG:
@@ -1276,7 +1624,7 @@ class Parser:
         name = self.expect('IDENT')[1]
         params = []
 
-        while self.peek()[0] == 'IDENT':
+        while self.peek_type() == 'IDENT':
             params.append(self.expect('IDENT')[1])
 
         self.expect('NEWLINE')
@@ -1308,9 +1656,9 @@ class Parser:
         params = []
 
         # Collect parameter names until we hit '->'
-        while self.peek()[0] == 'IDENT':
+        while self.peek_type() == 'IDENT':
             params.append(self.expect('IDENT')[1])
-            if self.peek()[0] == 'ARROW':
+            if self.peek_type() == 'ARROW':
                 break
 
         # Expect the arrow
@@ -1337,7 +1685,7 @@ class Parser:
         self.expect('DEDENT')
 
         elif_chains = []
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else if':
+        while self.peek_type() == 'KEYWORD' and self.peek()[1] == 'else if':
             self.expect('KEYWORD', 'else if')
             elif_cond = self.parse_full_expression()
             self.expect('NEWLINE')
@@ -1347,7 +1695,7 @@ class Parser:
             elif_chains.append((elif_cond, elif_body))
 
         else_body = None
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else':
+        if self.peek_type() == 'KEYWORD' and self.peek()[1] == 'else':
             self.expect('KEYWORD', 'else')
             self.expect('NEWLINE')
             self.expect('INDENT')
@@ -1373,7 +1721,7 @@ class Parser:
         self.expect('KEYWORD', 'for')
         var = self.expect('IDENT')[1]
         # Check for for-each syntax: for item in collection
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'in':
+        if self.peek_type() == 'KEYWORD' and self.peek()[1] == 'in':
             self.expect('KEYWORD', 'in')
             iterable = self.parse_full_expression()
             self.expect('NEWLINE')
@@ -1436,7 +1784,7 @@ class Parser:
         condition = self.parse_full_expression()
         # Check for optional string message
         message = None
-        if self.pos < len(self.tokens):
+        if self.pos < self._end:
             next_tok = self.peek()
             if next_tok[0] == 'STRING':
                 message = StringNode(process_escapes(self.advance()[1][1:-1]))
@@ -1464,7 +1812,7 @@ class Parser:
         self.expect('INDENT')
 
         cases = []
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'case':
+        while self.peek_type() == 'KEYWORD' and self.peek()[1] == 'case':
             self.expect('KEYWORD', 'case')
             # Parse first pattern
             is_wildcard = False
@@ -1493,13 +1841,13 @@ class Parser:
 
             # Parse additional patterns with |
             if not is_wildcard and not binding_name:
-                while self.peek()[0] == 'BAR':
+                while self.peek_type() == 'BAR':
                     self.advance()  # consume |
                     patterns.append(self.parse_atom())
 
             # Parse optional guard: if condition
             guard = None
-            if not is_wildcard and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'if':
+            if not is_wildcard and self.peek_type() == 'KEYWORD' and self.peek()[1] == 'if':
                 self.advance()  # consume 'if'
                 guard = self.parse_full_expression()
 
@@ -1528,9 +1876,9 @@ class Parser:
         self.expect('INDENT')
 
         variants = []
-        while self.pos < len(self.tokens):
+        while self.pos < self._end:
             self.skip_newlines()
-            if self.pos >= len(self.tokens):
+            if self.pos >= self._end:
                 break
             pk = self.peek()
             if pk[0] == 'DEDENT':
@@ -1554,7 +1902,9 @@ class Parser:
             debug("Parsing import statement...")
         self.expect('KEYWORD', 'import')
         # Accept a string literal as the module path
-        token_type, value, *_ = self.peek()
+        tok = self.tokens[self.pos]
+        token_type = tok[0]
+        value = tok[1]
         if token_type == 'STRING':
             self.advance()
             # Strip quotes
@@ -1582,12 +1932,16 @@ class Parser:
         if DEBUG:
             debug("Parsing block...")
         statements = []
-        while self.peek()[0] != 'DEDENT' and self.peek()[0] != 'EOF':
-            statement = self.parse_statement()
+        append = statements.append
+        parse_statement = self.parse_statement
+        skip_newlines = self.skip_newlines
+        types = self.token_types
+        n = self._end
+        while self.pos < n and types[self.pos] != 'DEDENT':
+            statement = parse_statement()
             if statement:
-                statements.append(statement)
-            while self.peek()[0] == 'NEWLINE':
-                self.advance()
+                append(statement)
+            skip_newlines()
         if DEBUG:
             debug(f"Parsed block: {statements}\n")
         return statements
@@ -1596,14 +1950,17 @@ class Parser:
         if DEBUG:
             debug(f"Parsing function call for: {name}")
         arguments = []
-        while self.peek()[0] in _FUNC_CALL_ARG_TOKENS:
-            pk = self.peek()
-            if pk[0] == 'KEYWORD' and pk[1] in _ATOM_KEYWORDS:
-                arguments.append(self.parse_atom())
-            elif pk[0] == 'KEYWORD':
+        append = arguments.append
+        parse_atom = self.parse_atom
+        tokens = self.tokens
+        types = self.token_types
+        while True:
+            token_type = types[self.pos]
+            if token_type not in _FUNC_CALL_ARG_TOKENS:  # includes EOF
+                break
+            if token_type == 'KEYWORD' and tokens[self.pos][1] not in _ATOM_KEYWORDS:
                 break  # Don't consume control flow keywords as arguments
-            else:
-                arguments.append(self.parse_atom())
+            append(parse_atom())
         function_call_node = FunctionCallNode(name, arguments)
         if DEBUG:
             debug(f"Created {function_call_node}\n")
@@ -1623,11 +1980,16 @@ class Parser:
     def parse_full_expression(self):
         return self.parse_pipe()
 
+    # The precedence-climbing methods below run once per level for every
+    # operand, so they read the current token straight from the token
+    # lists bound to locals instead of calling peek()/peek_type().
+
     def parse_pipe(self):
         """Parse pipe expressions: expr (|> expr)*"""
         left = self.parse_ternary()
-        while self.peek()[0] == 'PIPE':
-            self.advance()
+        types = self.token_types
+        while types[self.pos] == 'PIPE':
+            self.pos += 1
             right = self.parse_ternary()
             left = PipeNode(left, right)
         return left
@@ -1635,11 +1997,13 @@ class Parser:
     def parse_ternary(self):
         """Parse ternary conditional: true_expr if condition else false_expr"""
         true_expr = self.parse_logical_or()
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'if':
-            self.advance()
+        types = self.token_types
+        tokens = self.tokens
+        if types[self.pos] == 'KEYWORD' and tokens[self.pos][1] == 'if':
+            self.pos += 1
             condition = self.parse_logical_or()
-            if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else':
-                self.advance()
+            if types[self.pos] == 'KEYWORD' and tokens[self.pos][1] == 'else':
+                self.pos += 1
                 false_expr = self.parse_ternary()
                 return TernaryNode(condition, true_expr, false_expr)
             else:
@@ -1648,24 +2012,30 @@ class Parser:
 
     def parse_logical_or(self):
         left = self.parse_logical_and()
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'or':
-            self.advance()
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'KEYWORD' and tokens[self.pos][1] == 'or':
+            self.pos += 1
             right = self.parse_logical_and()
             left = LogicalNode(left, 'or', right)
         return left
 
     def parse_logical_and(self):
         left = self.parse_comparison()
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'and':
-            self.advance()
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'KEYWORD' and tokens[self.pos][1] == 'and':
+            self.pos += 1
             right = self.parse_comparison()
             left = LogicalNode(left, 'and', right)
         return left
 
     def parse_comparison(self):
         left = self.parse_expression()
-        if self.peek()[0] in _COMPARISON_OPS:
-            _, op_val, *_ = self.advance()
+        pos = self.pos
+        if self.token_types[pos] in _COMPARISON_OPS:
+            op_val = self.tokens[pos][1]
+            self.pos = pos + 1
             right = self.parse_expression()
             return CompareNode(left, op_val, right)
         return left
@@ -1675,8 +2045,11 @@ class Parser:
         if DEBUG:
             debug("Parsing expression...")
         left = self.parse_term_mul()
-        while self.peek()[0] == 'OP' and self.peek()[1] in ('+', '-'):
-            op = self.expect('OP')[1]
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'OP' and tokens[self.pos][1] in ('+', '-'):
+            op = tokens[self.pos][1]
+            self.pos += 1
             right = self.parse_term_mul()
             left = BinaryOpNode(left, op, right)
         if DEBUG:
@@ -1687,21 +2060,28 @@ class Parser:
 
     def parse_term_mul(self):
         left = self.parse_unary()
-        while self.peek()[0] == 'OP' and self.peek()[1] in ('*', '/', '%'):
-            op = self.expect('OP')[1]
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'OP' and tokens[self.pos][1] in ('*', '/', '%'):
+            op = tokens[self.pos][1]
+            self.pos += 1
             right = self.parse_unary()
             left = BinaryOpNode(left, op, right)
         return left
 
     def parse_unary(self):
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'not':
-            self.advance()
-            operand = self.parse_unary()
-            return UnaryOpNode('not', operand)
-        if self.peek()[0] == 'OP' and self.peek()[1] == '-':
-            self.advance()
-            operand = self.parse_unary()
-            return UnaryOpNode('-', operand)
+        pos = self.pos
+        token_type = self.token_types[pos]
+        if token_type == 'KEYWORD' or token_type == 'OP':
+            value = self.tokens[pos][1]
+            if value == 'not' and token_type == 'KEYWORD':
+                self.pos = pos + 1
+                operand = self.parse_unary()
+                return UnaryOpNode('not', operand)
+            if value == '-' and token_type == 'OP':
+                self.pos = pos + 1
+                operand = self.parse_unary()
+                return UnaryOpNode('-', operand)
         return self.parse_postfix()
 
     def parse_postfix(self):
@@ -1711,21 +2091,22 @@ class Parser:
 
     def _parse_postfix_chain(self, node):
         """Parse [index] or [start:end] chains on an already-parsed node."""
-        while self.peek()[0] == 'LBRACKET':
+        types = self.token_types
+        while types[self.pos] == 'LBRACKET':
             self.expect('LBRACKET')
-            if self.peek()[0] == 'COLON':
+            if self.peek_type() == 'COLON':
                 self.advance()
                 end_expr = None
-                if self.peek()[0] != 'RBRACKET':
+                if self.peek_type() != 'RBRACKET':
                     end_expr = self.parse_full_expression()
                 self.expect('RBRACKET')
                 node = SliceNode(node, None, end_expr)
             else:
                 start_expr = self.parse_full_expression()
-                if self.peek()[0] == 'COLON':
+                if self.peek_type() == 'COLON':
                     self.advance()
                     end_expr = None
-                    if self.peek()[0] != 'RBRACKET':
+                    if self.peek_type() != 'RBRACKET':
                         end_expr = self.parse_full_expression()
                     self.expect('RBRACKET')
                     node = SliceNode(node, start_expr, end_expr)
@@ -1735,113 +2116,127 @@ class Parser:
         return node
 
     def parse_atom(self):
-        token_type, value, *_ = self.peek()
+        token_type = self.token_types[self.pos]
+        if DEBUG:
+            debug(f"Parsing atom: token_type={token_type}, "
+                  f"value={repr(self.tokens[self.pos][1])}")
+        handler = self._atom_dispatch.get(token_type)
+        if handler is None:
+            raise SyntaxError(f'Unexpected token: {self.tokens[self.pos][1]}')
+        return handler()
+
+    # ── parse_atom handlers, keyed by token type in _atom_dispatch ──
+
+    def _parse_number_atom(self):
+        value = self.advance()[1]
+        number_node = NumberNode(float(value))
         if DEBUG:
-            debug(f"Parsing atom: token_type={token_type}, value={repr(value)}")
+            debug(f"parse_atom returning NumberNode: {number_node}")
+        return number_node
 
-        if token_type == 'NUMBER':
-            self.advance()
-            number_node = NumberNode(float(value))
-            if DEBUG:
-                debug(f"parse_atom returning NumberNode: {number_node}")
-            return number_node
-        elif token_type == 'STRING':
-            self.advance()
-            string_node = StringNode(process_escapes(value[1:-1]))
+    def _parse_string_atom(self):
+        value = self.advance()[1]
+        string_node = StringNode(process_escapes(value[1:-1]))
+        if DEBUG:
+            debug(f"parse_atom returning StringNode: {string_node}")
+        return string_node
+
+    def _parse_fstring_atom(self):
+        value = self.advance()[1]
+        fstring_node = self.parse_fstring(value)
+        if DEBUG:
+            debug(f"parse_atom returning FStringNode: {fstring_node}")
+        return fstring_node
+
+    def _parse_keyword_atom(self):
+        value = self.tokens[self.pos][1]
+        handler = self._atom_keyword_dispatch.get(value)
+        if handler is None:
+            raise SyntaxError(f'Unexpected token: {value}')
+        return handler()
+
+    def _parse_true_atom(self):
+        self.advance()
+        return BoolNode(True)
+
+    def _parse_false_atom(self):
+        self.advance()
+        return BoolNode(False)
+
+    def _parse_len_atom(self):
+        self.advance()
+        arg = self.parse_atom()
+        return LenNode(arg)
+
+    def _parse_pop_atom(self):
+        self.advance()
+        list_name = self.expect('IDENT')[1]
+        return PopNode(list_name)
+
+    def _parse_paren_atom(self):
+        self.expect('LPAREN')
+        expr = self.parse_full_expression()
+        self.expect('RPAREN')
+        return expr
+
+    def _parse_ident_atom(self):
+        value = self.advance()[1]
+        pk = self.peek()
+        # Dot notation for enum access: EnumName.VARIANT
+        if pk[0] == 'DOT':
+            self.advance()  # consume DOT
+            variant = self.expect('IDENT')[1]
+            return EnumAccessNode(value, variant)
+        # Don't treat as function call if next is [ (indexing handled in parse_postfix)
+        # UNLESS the identifier is a known builtin function — then [ starts
+        # a list argument, not an index operation.  (Fixes #18)
+        if pk[0] == 'LBRACKET' and value not in self.BUILTIN_FUNCTIONS:
+            return IdentifierNode(value)
+        if pk[0] == 'LBRACKET' and value in self.BUILTIN_FUNCTIONS:
+            func_call = self.parse_function_call(value)
+            return func_call
+        # Check if next token could be a function argument
+        if pk[0] in _PRIMARY_TOKENS:
+            func_call = self.parse_function_call(value)
             if DEBUG:
-                debug(f"parse_atom returning StringNode: {string_node}")
-            return string_node
-        elif token_type == 'FSTRING':
-            self.advance()
-            fstring_node = self.parse_fstring(value)
+                debug(f"parse_atom returning FunctionCallNode: {func_call}")
+            return func_call
+        elif pk[0] == 'IDENT':
+            func_call = self.parse_function_call(value)
             if DEBUG:
-                debug(f"parse_atom returning FStringNode: {fstring_node}")
-            return fstring_node
-        elif token_type == 'KEYWORD' and value == 'true':
-            self.advance()
-            return BoolNode(True)
-        elif token_type == 'KEYWORD' and value == 'false':
-            self.advance()
-            return BoolNode(False)
-        elif token_type == 'KEYWORD' and value == 'len':
-            self.advance()
-            arg = self.parse_atom()
-            return LenNode(arg)
-        elif token_type == 'KEYWORD' and value == 'pop':
-            self.advance()
-            list_name = self.expect('IDENT')[1]
-            return PopNode(list_name)
-        elif token_type == 'KEYWORD' and value == 'lambda':
-            return self.parse_lambda()
-        elif token_type == 'LPAREN':
-            self.expect('LPAREN')
-            expr = self.parse_full_expression()
-            self.expect('RPAREN')
-            return expr
-        elif token_type == 'LBRACKET':
-            return self.parse_list_literal()
-        elif token_type == 'LBRACE':
-            return self.parse_map_literal()
-        elif token_type == 'IDENT':
-            self.advance()
-            pk = self.peek()
-            # Dot notation for enum access: EnumName.VARIANT
-            if pk[0] == 'DOT':
-                self.advance()  # consume DOT
-                variant = self.expect('IDENT')[1]
-                return EnumAccessNode(value, variant)
-            # Don't treat as function call if next is [ (indexing handled in parse_postfix)
-            # UNLESS the identifier is a known builtin function — then [ starts
-            # a list argument, not an index operation.  (Fixes #18)
-            if pk[0] == 'LBRACKET' and value not in self.BUILTIN_FUNCTIONS:
-                return IdentifierNode(value)
-            if pk[0] == 'LBRACKET' and value in self.BUILTIN_FUNCTIONS:
-                func_call = self.parse_function_call(value)
-                return func_call
-            # Check if next token could be a function argument
-            if pk[0] in _PRIMARY_TOKENS:
-                func_call = self.parse_function_call(value)
-                if DEBUG:
-                    debug(f"parse_atom returning FunctionCallNode: {func_call}")
-                return func_call
-            elif pk[0] == 'IDENT':
-                func_call = self.parse_function_call(value)
-                if DEBUG:
-                    debug(f"parse_atom returning FunctionCallNode: {func_call}")
-                return func_call
-            elif pk[0] == 'KEYWORD' and pk[1] in _ATOM_KEYWORDS:
-                func_call = self.parse_function_call(value)
-                return func_call
-            elif pk[0] == 'LBRACE':
-                func_call = self.parse_function_call(value)
-                return func_call
-            else:
-                # Zero-argument builtin function call (only for builtins that take no args)
-                if value in self.ZERO_ARG_BUILTINS:
-                    return FunctionCallNode(value, [])
-                ident_node = IdentifierNode(value)
-                if DEBUG:
-                    debug(f"parse_atom returning IdentifierNode: {ident_node}")
-                return ident_node
+                debug(f"parse_atom returning FunctionCallNode: {func_call}")
+            return func_call
+        elif pk[0] == 'KEYWORD' and pk[1] in _ATOM_KEYWORDS:
+            func_call = self.parse_function_call(value)
+            return func_call
+        elif pk[0] == 'LBRACE':
+            func_call = self.parse_function_call(value)
+            return func_call
         else:
-            raise SyntaxError(f'Unexpected token: {value}')
+            # Zero-argument builtin function call (only for builtins that take no args)
+            if value in self.ZERO_ARG_BUILTINS:
+                return FunctionCallNode(value, [])
+            ident_node = IdentifierNode(value)
+            if DEBUG:
+                debug(f"parse_atom returning IdentifierNode: {ident_node}")
+            return ident_node
 
     def parse_list_literal(self):
         self.expect('LBRACKET')
         # Empty list
-        if self.peek()[0] == 'RBRACKET':
+        if self.peek_type() == 'RBRACKET':
             self.expect('RBRACKET')
             return ListNode([])
         # Parse first expression
         first = self.parse_full_expression()
         # Check for list comprehension: [expr for var in iterable]
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'for':
+        if self.peek_type() == 'KEYWORD' and self.peek()[1] == 'for':
             return self._parse_list_comprehension(first)
         # Regular list literal
         elements = [first]
-        while self.peek()[0] == 'COMMA':
+        while self.peek_type() == 'COMMA':
             self.advance()
-            if self.peek()[0] == 'RBRACKET':
+            if self.peek_type() == 'RBRACKET':
                 break  # trailing comma
             elements.append(self.parse_full_expression())
         self.expect('RBRACKET')
@@ -1861,7 +2256,7 @@ class Parser:
         # comprehension filter clause.
         iterable = self.parse_logical_or()
         condition = None
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'if':
+        if self.peek_type() == 'KEYWORD' and self.peek()[1] == 'if':
             self.advance()
             condition = self.parse_logical_or()
         self.expect('RBRACKET')
@@ -1871,12 +2266,12 @@ class Parser:
         """Parse a map literal: { key: value, key2: value2 }"""
         self.expect('LBRACE')
         pairs = []
-        while self.peek()[0] != 'RBRACE':
+        while self.peek_type() != 'RBRACE':
             key = self.parse_full_expression()
             self.expect('COLON')
             val = self.parse_full_expression()
             pairs.append((key, val))
-            if self.peek()[0] == 'COMMA':
+            if self.peek_type() == 'COMMA':
                 self.advance()
         self.expect('RBRACE')
         return MapNode(pairs)
@@ -1962,11 +2357,21 @@ class Parser:
                 expr_text = content[i + 1:j - 1].strip()
                 if not expr_text:
                     raise SyntaxError("Empty expression in f-string")
-                # Tokenize and parse the expression
-                expr_code = expr_text + '\n'
-                expr_tokens = list(tokenize(expr_code))
-                expr_parser = Parser(expr_tokens)
-                expr_node = expr_parser.parse_full_expression()
+                # A bare name, the usual interpolation, becomes the node
+                # parse_atom would build without tokenizing it (on line 1
+                # of the expression text, as the sub-parser tags it);
+                # anything else is tokenized and parsed as an expression.
+                if (_FSTRING_NAME_RE.fullmatch(expr_text)
+                        and expr_text not in _KEYWORD_VALUES):
+                    if expr_text in self.ZERO_ARG_BUILTINS:
+                        expr_node = FunctionCallNode(expr_text, [])
+                    else:
+                        expr_node = IdentifierNode(sys.intern(expr_text))
+                    expr_node.line_num = 1
+                else:
+                    expr_code = expr_text + '\n'
+                    expr_parser = Parser(iter_tokens(expr_code))
+                    expr_node = expr_parser.parse_full_expression()
                 parts.append(expr_node)
                 i = j
             elif ch == '}':
@@ -1987,11 +2392,18 @@ class Parser:
         return FStringNode(parts)
 
     def skip_newlines(self):
-        while self.peek()[0] == 'NEWLINE':
-            self.advance()
+        types = self.token_types
+        pos = self.pos
+        while types[pos] == 'NEWLINE':  # stops at the EOF sentinel
+            pos += 1
+        self.pos = pos
 
     def peek(self):
-        return self.tokens[self.pos] if self.pos < len(self.tokens) else ('EOF', None)
+        return self.tokens[self.pos]
+
+    def peek_type(self):
+        """Return the type of the current token ('EOF' at the end)."""
+        return self.token_types[self.pos]
 
     def advance(self):
         token = self.tokens[self.pos]
@@ -2001,7 +2413,9 @@ class Parser:
         return token
 
     def expect(self, token_type, value=None):
-        actual_type, actual_value, *_ = self.advance()
+        token = self.advance()
+        actual_type = token[0]
+        actual_value = token[1]
         if DEBUG:
             debug(f"Expecting token: {token_type} {repr(value)}. Got: {actual_type} {repr(actual_value)}")
         if actual_type != token_type or (value and actual_value != value):
@@ -2053,6 +2467,61 @@ class YieldSignal(Exception):
     def __init__(self, value):
         self.value = value
 
+_new_chain_map = ChainMap.__new__
+
+
+def _chain_scope(local, parent):
+    """Return a scope that reads *local* first, then *parent*.
+
+    Equivalent to ``ChainMap(local, parent)``, but when *parent* is itself
+    a ChainMap its maps are spliced in flat.  Nested ChainMaps resolve a
+    miss by recursing through one Python-level ``__getitem__`` per call
+    level, so without flattening every global read inside deep recursion
+    costs a Python call per frame of depth.
+
+    The maps list is set directly, skipping ChainMap's Python-level
+    ``__init__`` (``list(maps)``), since a scope is built on every call.
+    """
+    scope = _new_chain_map(ChainMap)
+    if type(parent) is ChainMap:
+        scope.maps = [local, *parent.maps]
+    else:
+        scope.maps = [local, parent]
+    return scope
+
+
+def _scope_get(scope, name, default):
+    """Return ``scope.get(name, default)`` for a dict or ChainMap scope.
+
+    ChainMap.get runs ``__contains__`` (a generator over the maps) and
+    then ``__getitem__``, which raises and catches a KeyError for every
+    map that misses; a function's scope reads its locals and globals by
+    probing each map with C-level ``in`` and indexing instead.
+    """
+    if type(scope) is not ChainMap:
+        return scope.get(name, default)
+    for mapping in scope.maps:
+        if name in mapping:
+            return mapping[name]
+    return default
+
+
+def _snapshot_scope(scope):
+    """Return a plain dict copy of *scope* (a dict or a ChainMap).
+
+    Same result as ``dict(scope)``, but a ChainMap is merged map by map
+    with ``dict.update`` (outermost first, so inner bindings win) rather
+    than through ChainMap's Python-level ``__iter__``/``__getitem__``
+    once per key, which is dozens of times slower for a call-depth scope.
+    """
+    if type(scope) is not ChainMap:
+        return dict(scope)
+    result = {}
+    for mapping in reversed(scope.maps):
+        result.update(mapping)
+    return result
+
+
 class GeneratorValue:
     """Runtime representation of a generator — a lazy iterable.
 
@@ -2082,21 +2551,9 @@ class GeneratorValue:
     def _run(self):
         """Run the generator body in a background thread."""
         import threading
+        saved = self._push_scope()
         try:
-            # Create a fresh interpreter scope snapshot
-            saved_vars = self.interpreter.variables.copy()
-            saved_funcs = self.interpreter.functions.copy()
             try:
-                # Set up parameters
-                for param, arg_val in zip(self.func_node.params, self.args):
-                    self.interpreter.variables[param] = arg_val
-
-                # Inject closure scope
-                if hasattr(self.func_node, 'closure_scope') and self.func_node.closure_scope:
-                    for cname, cval in self.func_node.closure_scope.items():
-                        if cname not in self.interpreter.variables:
-                            self.interpreter.variables[cname] = cval
-
                 for stmt in self.func_node.body:
                     self.interpreter.interpret(stmt)
             except YieldSignal as ys:
@@ -2107,11 +2564,31 @@ class GeneratorValue:
             except Exception as e:
                 self._error = e
         finally:
-            self.interpreter.variables = saved_vars
-            self.interpreter.functions = saved_funcs
+            self.interpreter.variables, self.interpreter.functions = saved
             self._done = True
             self._yield_ready.set()
 
+    def _push_scope(self):
+        """Give the generator body its own variable and function layer.
+
+        Pushes a ChainMap layer holding the parameters (and any closure
+        variables the caller's scope doesn't define) over the caller's
+        scope instead of copying it; writes made by the body land in that
+        layer and vanish when it is popped.  Returns the caller's
+        ``(variables, functions)`` pair for restoring.
+        """
+        interp = self.interpreter
+        saved = (interp.variables, interp.functions)
+        local = dict(zip(self.func_node.params, self.args))
+        cs = getattr(self.func_node, 'closure_scope', None)
+        if cs:
+            for cname, cval in cs.items():
+                if cname not in local and cname not in saved[0]:
+                    local[cname] = cval
+        interp.variables = _chain_scope(local, saved[0])
+        interp.functions = _chain_scope({}, saved[1])
+        return saved
+
     def _ensure_started(self):
         if not self._started:
             self._started = True
@@ -2119,25 +2596,15 @@ class GeneratorValue:
 
     def _collect_all(self):
         """Eagerly collect all yielded values by executing the function body."""
-        saved_vars = self.interpreter.variables.copy()
-        saved_funcs = self.interpreter.functions.copy()
+        saved = self._push_scope()
         try:
-            for param, arg_val in zip(self.func_node.params, self.args):
-                self.interpreter.variables[param] = arg_val
-
-            if hasattr(self.func_node, 'closure_scope') and self.func_node.closure_scope:
-                for cname, cval in self.func_node.closure_scope.items():
-                    if cname not in self.interpreter.variables:
-                        self.interpreter.variables[cname] = cval
-
             self._execute_collecting(self.func_node.body)
         except ReturnSignal:
             pass
         except StopIteration:
             pass
         finally:
-            self.interpreter.variables = saved_vars
-            self.interpreter.functions = saved_funcs
+            self.interpreter.variables, self.interpreter.functions = saved
             self._done = True
 
     def _execute_collecting(self, stmts):
@@ -2182,6 +2649,8 @@ class LambdaValue:
     scope (closure) so variables from the enclosing environment are
     accessible inside the lambda body.
     """
+    __slots__ = ('params', 'body_expr', 'closure')
+
     def __init__(self, params, body_expr, closure):
         self.params = params       # parameter names
         self.body_expr = body_expr  # AST expression node
@@ -2194,6 +2663,601 @@ class LambdaValue:
     def __str__(self):
         return self.__repr__()
 
+# ── Numeric kernels ──────────────────────────────────────────────────
+# Small user functions that only do arithmetic on their parameters, e.g.
+#
+#     function hyp2 a b
+#         return a * a + b * b
+#
+# (optionally calling pure math builtins such as sqrt or abs, or other
+# user functions that are kernels themselves) are lowered once to a real
+# Python function, so a call runs as CPython bytecode instead of walking
+# the AST (evaluate() recursion, ChainMap scope, ReturnSignal).  Kernels
+# have no side effects, so the interpreter can always fall back to the
+# tree-walking path — for non-numeric arguments, near a depth limit, or
+# when the kernel raises (e.g. division by zero) — and get exactly the
+# behaviour and error it had before.
+
+_KERNEL_MAX_DEPTH = 100  # nesting cap for expressions lowered into a kernel
+
+# '/' and '%' compile to the bare Python operators too: dividing by zero
+# raises ZeroDivisionError inside the kernel, which makes the call fall
+# back, and the tree-walker then raises the interpreter's own error.
+_KERNEL_BINARY_OPS = {'+': '+', '-': '-', '*': '*', '/': '/', '%': '%'}
+_KERNEL_COMPARE_OPS = frozenset({'==', '!=', '<', '>', '<=', '>='})
+
+# Builtins a kernel may call: deterministic, side-effect free and numeric.
+# Kernels call them through the interpreter's own builtins table, so
+# argument checks and error messages are the builtin's own.
+_KERNEL_BUILTINS = frozenset({
+    'abs', 'round', 'floor', 'ceil', 'sqrt', 'power', 'sin', 'cos', 'tan',
+    'log', 'log10', 'min', 'max', 'clamp', 'lerp',
+})
+
+
+class _KernelUnsupported(Exception):
+    """Raised while lowering when a function is not a numeric kernel."""
+
+
+class _NumericKernel:
+    """A compiled numeric kernel: the Python function plus its eval depth.
+
+    ``fn`` takes the interpreter's builtins table and its ``_kernel_call``
+    method followed by the arguments.  ``eval_depth`` is the deepest chain
+    of non-leaf expression nodes in the body, i.e. how far the tree-walker
+    would push ``_eval_depth``; ``builtins`` names the builtins the body
+    calls.
+    """
+    __slots__ = ('fn', 'arity', 'eval_depth', 'builtins')
+
+    def __init__(self, fn, arity, eval_depth, builtins):
+        self.fn = fn
+        self.arity = arity
+        self.eval_depth = eval_depth
+        self.builtins = builtins
+
+
+def _kernel_name(name):
+    ident = 'v_' + name
+    if not ident.isidentifier():
+        raise _KernelUnsupported(name)
+    return ident
+
+
+def _kernel_range(start, end):
+    """``range`` for a ``for`` loop inside a kernel, with the loop guard.
+
+    An oversized range raises, so the caller falls back and the
+    tree-walker reports the error.
+    """
+    start = int(start)
+    end = int(end)
+    if abs(end - start) > MAX_LOOP_ITERATIONS:
+        raise OverflowError(end - start)
+    return range(start, end)
+
+
+def _lower_kernel_expr(node, defined, depth, used):
+    """Return ``(python_source, eval_depth)`` for a numeric expression."""
+    node_type = type(node)
+    if node_type is NumberNode:
+        value = node.value
+        if type(value) not in (int, float) or not math.isfinite(value):
+            raise _KernelUnsupported(node)
+        return repr(value), 0
+    if node_type is BoolNode:
+        return repr(bool(node.value)), 0
+    if node_type is IdentifierNode:
+        if node.name not in defined:
+            raise _KernelUnsupported(node)
+        return _kernel_name(node.name), 0
+    if depth >= _KERNEL_MAX_DEPTH:
+        raise _KernelUnsupported(node)
+    depth += 1
+    if node_type is BinaryOpNode:
+        left, ld = _lower_kernel_expr(node.left, defined, depth, used)
+        right, rd = _lower_kernel_expr(node.right, defined, depth, used)
+        op = node.operator
+        if op not in _KERNEL_BINARY_OPS:
+            raise _KernelUnsupported(node)
+        src = f'({left} {_KERNEL_BINARY_OPS[op]} {right})'
+        return src, max(ld, rd) + 1
+    if node_type is CompareNode:
+        if node.operator not in _KERNEL_COMPARE_OPS:
+            raise _KernelUnsupported(node)
+        left, ld = _lower_kernel_expr(node.left, defined, depth, used)
+        right, rd = _lower_kernel_expr(node.right, defined, depth, used)
+        return f'({left} {node.operator} {right})', max(ld, rd) + 1
+    if node_type is LogicalNode:
+        if node.operator not in ('and', 'or'):
+            raise _KernelUnsupported(node)
+        left, ld = _lower_kernel_expr(node.left, defined, depth, used)
+        right, rd = _lower_kernel_expr(node.right, defined, depth, used)
+        return f'(bool({left}) {node.operator} bool({right}))', max(ld, rd) + 1
+    if node_type is UnaryOpNode:
+        operand, od = _lower_kernel_expr(node.operand, defined, depth, used)
+        if node.operator == '-':
+            return f'(-{operand})', od + 1
+        if node.operator == 'not':
+            return f'(not {operand})', od + 1
+        raise _KernelUnsupported(node)
+    if node_type is TernaryNode:
+        cond, cd = _lower_kernel_expr(node.condition, defined, depth, used)
+        true_src, td = _lower_kernel_expr(node.true_expr, defined, depth, used)
+        false_src, fd = _lower_kernel_expr(node.false_expr, defined, depth, used)
+        return f'({true_src} if {cond} else {false_src})', max(cd, td, fd) + 1
+    if node_type is FunctionCallNode:
+        name = node.name
+        if name in _KERNEL_BUILTINS and not node.arguments:
+            raise _KernelUnsupported(node)
+        args = []
+        arg_depth = 0
+        for arg in node.arguments:
+            src, d = _lower_kernel_expr(arg, defined, depth, used)
+            args.append(src)
+            arg_depth = max(arg_depth, d)
+        used.add(name)
+        if name in _KERNEL_BUILTINS:
+            return f"_builtins[{name!r}]([{', '.join(args)}])", arg_depth + 1
+        # Any other name must be a user function with a kernel of its
+        # own; _kernel_builtins() checks that once the body is lowered.
+        return f"_call({name!r}, {depth}, [{', '.join(args)}])", arg_depth + 1
+    raise _KernelUnsupported(node)
+
+
+def _lower_kernel_body(body, defined, lines, indent, used,
+                       in_loop=False, returns=True):
+    """Append Python source for *body* to *lines*; return its eval depth.
+
+    *defined* holds the names that are certainly bound at this point.
+    Names first assigned inside an ``if`` branch or a ``for`` body stay
+    local to it, since reading them afterwards could fall through to a
+    global in the tree-walker.  ``break`` / ``continue`` are accepted
+    only *in_loop*, and ``return`` only where *returns* is set.
+    """
+    pad = '    ' * indent
+    max_depth = 0
+    for stmt in body:
+        stmt_type = type(stmt)
+        d = 0
+        if stmt_type is AssignmentNode:
+            src, d = _lower_kernel_expr(stmt.expression, defined, 0, used)
+            lines.append(f'{pad}{_kernel_name(stmt.name)} = {src}')
+            defined.add(stmt.name)
+        elif stmt_type is ReturnNode and returns:
+            src, d = _lower_kernel_expr(stmt.expression, defined, 0, used)
+            lines.append(f'{pad}return {src}')
+        elif stmt_type is IfNode:
+            branches = [(stmt.condition, stmt.body)] + list(stmt.elif_chains)
+            for i, (cond, branch) in enumerate(branches):
+                src, cd = _lower_kernel_expr(cond, defined, 0, used)
+                lines.append(f"{pad}{'if' if i == 0 else 'elif'} {src}:")
+                lines.append(f'{pad}    pass')
+                bd = _lower_kernel_body(branch, set(defined), lines, indent + 1,
+                                        used, in_loop, returns)
+                d = max(d, cd, bd)
+            if stmt.else_body:
+                lines.append(f'{pad}else:')
+                lines.append(f'{pad}    pass')
+                d = max(d, _lower_kernel_body(stmt.else_body, set(defined), lines,
+                                              indent + 1, used, in_loop, returns))
+        elif stmt_type is ForNode:
+            start, sd = _lower_kernel_expr(stmt.start, defined, 0, used)
+            end, ed = _lower_kernel_expr(stmt.end, defined, 0, used)
+            lines.append(f'{pad}for {_kernel_name(stmt.var)} in _range({start}, {end}):')
+            lines.append(f'{pad}    pass')
+            bd = _lower_kernel_body(stmt.body, defined | {stmt.var}, lines,
+                                    indent + 1, used, True, returns)
+            d = max(sd, ed, bd)
+        elif stmt_type is BreakNode and in_loop:
+            lines.append(f'{pad}break')
+        elif stmt_type is ContinueNode and in_loop:
+            lines.append(f'{pad}continue')
+        else:
+            raise _KernelUnsupported(stmt)
+        max_depth = max(max_depth, d)
+    return max_depth
+
+
+def _kernel_builtins(used, functions):
+    """Split the names a kernel calls; return the builtins among them.
+
+    Every other name must be a user function in *functions* that is
+    itself a numeric kernel (compiled here if it has not been yet), or
+    _KernelUnsupported is raised.  A function is marked as no kernel
+    while it compiles, so recursion (direct or mutual) never qualifies
+    and self-recursive functions keep their call memo.
+    """
+    for name in used:
+        if name in _KERNEL_BUILTINS:
+            continue
+        callee = functions.get(name)
+        if type(callee) is not FunctionNode:
+            raise _KernelUnsupported(name)
+        kernel = callee._kernel
+        if kernel is None:
+            kernel = callee._kernel = _compile_numeric_kernel(callee, functions)
+        if not kernel:
+            raise _KernelUnsupported(name)
+    return tuple(sorted(used & _KERNEL_BUILTINS))
+
+
+def _compile_numeric_kernel(func_node, functions):
+    """Lower *func_node* to a ``_NumericKernel``, or return False.
+
+    Only functions built from assignments to locals, ``if`` / ``else if``
+    / ``else``, range ``for`` loops and ``return`` over numeric
+    expressions of their own parameters and locals (and calls to
+    ``_KERNEL_BUILTINS`` or to other kernels in *functions*) qualify;
+    anything else (recursion, globals, strings, while loops, printing,
+    ...) keeps using the tree-walker.
+    """
+    params = list(func_node.params)
+    if len(set(params)) != len(params):
+        return False
+    func_node._kernel = False  # until compiled: callees may not call back
+    lines = []
+    used = set()
+    try:
+        args = ''.join(', ' + _kernel_name(p) for p in params)
+        depth = _lower_kernel_body(func_node.body, set(params), lines, 1, used)
+        builtins = _kernel_builtins(used, functions)
+    except (_KernelUnsupported, RecursionError):
+        return False
+    lines.append('    return None')
+    source = f'def kernel(_builtins, _call{args}):\n' + '\n'.join(lines) + '\n'
+    namespace = {'_range': _kernel_range}
+    try:
+        exec(compile(source, f'<kernel {func_node.name}>', 'exec'), namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        return False
+    return _NumericKernel(namespace['kernel'], len(params), depth, builtins)
+
+
+# Arithmetic expressions get the same treatment: a tree of at least
+# _EXPR_KERNEL_MIN_OPS operators over numbers and variables, such as
+# ``x * x + y * y - 1`` or the loop condition ``i < n and x > 0``, becomes
+# one Python function of its variables, called from _eval_binary_op,
+# _eval_compare or _eval_logical when every variable holds an int or
+# float.  A tree of literals alone, such as ``24 * 60 / 2``, is folded to
+# its value.
+
+_EXPR_KERNEL_MIN_OPS = 2
+
+
+class _ExprKernel:
+    """A compiled numeric expression.
+
+    ``fn`` takes the values of ``names`` (the expression's variables, in
+    order); ``eval_depth`` is as for ``_NumericKernel``.
+    """
+    __slots__ = ('fn', 'names', 'eval_depth')
+
+    def __init__(self, fn, names, eval_depth):
+        self.fn = fn
+        self.names = names
+        self.eval_depth = eval_depth
+
+
+def _collect_numeric(node, names):
+    """Return the number of binary operators in a numeric expression tree.
+
+    Adds the variables it reads to *names* and raises _KernelUnsupported
+    for anything other than numbers, booleans, variables, arithmetic,
+    comparison and logical operators, unary minus and ``not``.
+    """
+    node_type = type(node)
+    if node_type is NumberNode or node_type is BoolNode:
+        return 0
+    if node_type is IdentifierNode:
+        if node.name not in names:
+            names.append(node.name)
+        return 0
+    if (node_type is BinaryOpNode
+            or (node_type is CompareNode and node.operator in _KERNEL_COMPARE_OPS)
+            or (node_type is LogicalNode and node.operator in ('and', 'or'))):
+        return (1 + _collect_numeric(node.left, names)
+                + _collect_numeric(node.right, names))
+    if node_type is UnaryOpNode and node.operator in ('-', 'not'):
+        return _collect_numeric(node.operand, names)
+    raise _KernelUnsupported(node)
+
+
+def _compile_expr_kernel(node):
+    """Lower the numeric expression rooted at *node* to an ``_ExprKernel``.
+
+    Returns False when the tree is not purely numeric or too small for
+    a kernel call to beat walking it.  A tree without variables is
+    evaluated here and its kernel returns that value; if evaluating it
+    raises, the tree-walker reports the error at run time instead.
+    """
+    names = []
+    try:
+        if _collect_numeric(node, names) < _EXPR_KERNEL_MIN_OPS:
+            return False
+        params = ', '.join(_kernel_name(n) for n in names)
+        src, depth = _lower_kernel_expr(node, set(names), 0, set())
+    except (_KernelUnsupported, RecursionError):
+        return False
+    namespace = {}
+    try:
+        exec(compile(f'def kernel({params}):\n    return {src}\n',
+                     '<expression kernel>', 'exec'), namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        return False
+    kernel = namespace['kernel']
+    if not names:
+        try:
+            value = kernel()
+        except Exception:
+            return False
+
+        def kernel():
+            return value
+    return _ExprKernel(kernel, tuple(names), depth)
+
+
+# A range ``for`` statement whose body is kernel-shaped, e.g.
+#
+#     for i 0 n
+#         total = total + i * i
+#
+# runs as one Python loop over the variables it uses.  The kernel takes
+# the loop bounds and the values of the variables it reads and returns
+# the final values of those it assigns, which execute_for stores back;
+# until then the interpreter's scope is untouched, so a kernel that
+# raises part-way can still fall back to re-running the loop as before.
+
+_KERNEL_UNSET = object()  # loop-kernel local that was never assigned
+
+
+class _LoopKernel:
+    """A compiled ``for`` loop.
+
+    ``fn`` takes the builtins table, ``_kernel_call``, the range bounds
+    and the values of ``inputs``, and returns the values of ``outputs``
+    (``_KERNEL_UNSET`` for a variable the loop never assigned).
+    ``eval_depth`` and ``builtins`` are as for ``_NumericKernel``.
+    """
+    __slots__ = ('fn', 'inputs', 'outputs', 'eval_depth', 'builtins')
+
+    def __init__(self, fn, inputs, outputs, eval_depth, builtins):
+        self.fn = fn
+        self.inputs = inputs
+        self.outputs = outputs
+        self.eval_depth = eval_depth
+        self.builtins = builtins
+
+
+def _collect_assigned(body, names):
+    """Add the variables assigned anywhere in a kernel-shaped *body* to *names*."""
+    for stmt in body:
+        stmt_type = type(stmt)
+        if stmt_type is AssignmentNode:
+            if stmt.name not in names:
+                names.append(stmt.name)
+        elif stmt_type is IfNode:
+            _collect_assigned(stmt.body, names)
+            for _, branch in stmt.elif_chains:
+                _collect_assigned(branch, names)
+            _collect_assigned(stmt.else_body or (), names)
+        elif stmt_type is ForNode:
+            if stmt.var not in names:
+                names.append(stmt.var)
+            _collect_assigned(stmt.body, names)
+
+
+def _compile_loop_kernel(node, scope, functions):
+    """Lower the ``for`` statement *node* to a ``_LoopKernel``, or return False.
+
+    The body must be what a numeric kernel accepts, minus ``return``.
+    A variable read before the body assigns it must be set in *scope*
+    (the variables when the loop first runs) and becomes an input.
+    User functions it calls are looked up in *functions*.
+    """
+    inputs = set()
+    while True:
+        lines = []
+        used = set()
+        try:
+            depth = _lower_kernel_body(node.body, inputs | {node.var}, lines, 2,
+                                       used, True, False)
+            break
+        except _KernelUnsupported as exc:
+            culprit = exc.args[0] if exc.args else None
+            if (type(culprit) is not IdentifierNode or culprit.name in inputs
+                    or culprit.name not in scope):
+                return False
+            inputs.add(culprit.name)
+        except RecursionError:
+            return False
+    inputs = tuple(sorted(inputs))
+    try:
+        builtins = _kernel_builtins(used, functions)
+    except (_KernelUnsupported, RecursionError):
+        return False
+    outputs = [node.var]
+    _collect_assigned(node.body, outputs)
+    try:
+        params = ''.join(', ' + _kernel_name(n) for n in inputs)
+        unset = [_kernel_name(n) for n in outputs if n not in inputs]
+        results = ''.join(_kernel_name(n) + ', ' for n in outputs)
+    except _KernelUnsupported:
+        return False
+    source = (f'def kernel(_builtins, _call, _start, _end{params}):\n'
+              f"    {' = '.join(unset)} = _unset\n"
+              f'    for {_kernel_name(node.var)} in range(_start, _end):\n'
+              + '\n'.join(lines)
+              + f'\n    return ({results})\n')
+    namespace = {
+        '_range': _kernel_range,
+        '_unset': _KERNEL_UNSET,
+    }
+    try:
+        exec(compile(source, f'<loop kernel {node.var}>', 'exec'), namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        return False
+    return _LoopKernel(namespace['kernel'], inputs, tuple(outputs), depth,
+                       builtins)
+
+
+# List literals of at least _LITERAL_LIST_MIN numbers, strings or booleans,
+# such as a lookup table, are built by copying their cached values.
+# Shorter ones are cheaper to evaluate element by element than to pass
+# the kernel gate.
+
+_LITERAL_LIST_MIN = 4
+_LITERAL_NODES = (NumberNode, StringNode, BoolNode)
+
+
+def _literal_values(elements):
+    """Return the values of *elements* if all are literals, else False."""
+    if len(elements) < _LITERAL_LIST_MIN:
+        return False
+    for element in elements:
+        if type(element) not in _LITERAL_NODES:
+            return False
+    return [element.value for element in elements]
+
+
+# Self-recursive pure functions (the naive ``fib``/``binomial`` shape,
+# which cannot be kernels because they call a user function) get a
+# per-function table of results keyed by argument values, turning the
+# exponential re-walk of identical subcalls into one walk per distinct
+# argument tuple.  Non-recursive functions are not memoized: a repeated
+# call is rarely worth a table entry, and the pure ones are already
+# kernels.  A full table drops its least recently used entry.
+
+_MEMO_MAX_ENTRIES = 65_536
+_MEMO_KEY_TYPES = frozenset({int, float, str})
+
+
+class _CallMemo:
+    """Cached results of a pure function.
+
+    ``results`` maps an argument key (see ``Interpreter._memo_key``) to
+    the return value, least recently used first; ``builtins`` names the
+    builtins the body calls.
+    """
+    __slots__ = ('results', 'builtins')
+
+    def __init__(self, builtins):
+        self.results = OrderedDict()
+        self.builtins = builtins
+
+
+def _scan_pure_expr(node, defined, calls):
+    """Raise _KernelUnsupported unless *node* is side-effect free.
+
+    Allows literals, the names in *defined*, operators, ternaries and
+    calls, whose names are added to *calls* for the caller to vet.
+    """
+    node_type = type(node)
+    if node_type is NumberNode or node_type is StringNode or node_type is BoolNode:
+        return
+    if node_type is IdentifierNode:
+        if node.name not in defined:
+            raise _KernelUnsupported(node)
+    elif node_type is BinaryOpNode or node_type is CompareNode or node_type is LogicalNode:
+        _scan_pure_expr(node.left, defined, calls)
+        _scan_pure_expr(node.right, defined, calls)
+    elif node_type is UnaryOpNode:
+        _scan_pure_expr(node.operand, defined, calls)
+    elif node_type is TernaryNode:
+        _scan_pure_expr(node.condition, defined, calls)
+        _scan_pure_expr(node.true_expr, defined, calls)
+        _scan_pure_expr(node.false_expr, defined, calls)
+    elif node_type is FunctionCallNode:
+        calls.add(node.name)
+        for arg in node.arguments:
+            _scan_pure_expr(arg, defined, calls)
+    else:
+        raise _KernelUnsupported(node)
+
+
+def _scan_pure_body(body, defined, calls):
+    """Like ``_scan_pure_expr`` for a statement list (see ``_lower_kernel_body``)."""
+    for stmt in body:
+        stmt_type = type(stmt)
+        if stmt_type is AssignmentNode:
+            _scan_pure_expr(stmt.expression, defined, calls)
+            defined.add(stmt.name)
+        elif stmt_type is ReturnNode:
+            _scan_pure_expr(stmt.expression, defined, calls)
+        elif stmt_type is IfNode:
+            for cond, branch in [(stmt.condition, stmt.body)] + list(stmt.elif_chains):
+                _scan_pure_expr(cond, defined, calls)
+                _scan_pure_body(branch, set(defined), calls)
+            if stmt.else_body:
+                _scan_pure_body(stmt.else_body, set(defined), calls)
+        elif stmt_type is ForNode:
+            _scan_pure_expr(stmt.start, defined, calls)
+            _scan_pure_expr(stmt.end, defined, calls)
+            _scan_pure_body(stmt.body, defined | {stmt.var}, calls)
+        elif stmt_type is BreakNode or stmt_type is ContinueNode:
+            pass
+        else:
+            raise _KernelUnsupported(stmt)
+
+
+def _find_tail_call(func_node):
+    """Return the call in a final ``return name ...`` of *func_node*, or False.
+
+    Only a self-call that is the last statement of the body qualifies; the
+    interpreter runs it by rebinding the parameters and starting the body
+    again instead of nesting another Python-level call.
+    """
+    body = func_node.body
+    if not body:
+        return False
+    last = body[-1]
+    if type(last) is not ReturnNode:
+        return False
+    call = last.expression
+    if type(call) is not FunctionCallNode or call.name != func_node.name:
+        return False
+    return call
+
+
+def _compile_call_memo(func_node):
+    """Return a ``_CallMemo`` for *func_node*, or False.
+
+    Qualifies when the body reads only its parameters and locals, calls
+    only itself and ``_KERNEL_BUILTINS``, does so at least once
+    recursively, and is otherwise made of the statements numeric kernels
+    accept -- so its result depends on nothing but the arguments.
+    """
+    params = list(func_node.params)
+    if len(set(params)) != len(params):
+        return False
+    calls = set()
+    try:
+        _scan_pure_body(func_node.body, set(params), calls)
+    except (_KernelUnsupported, RecursionError):
+        return False
+    name = func_node.name
+    if name not in calls:
+        return False
+    calls.discard(name)
+    if not calls <= _KERNEL_BUILTINS:
+        return False
+    return _CallMemo(tuple(sorted(calls)))
+
+
+# Interpreter methods whose overriding (by a subclass such as the
+# debugger/tracer, or by patching an instance like sauravcov/sauravprof)
+# means statements must really be executed one by one, so kernels are
+# bypassed.
+_KERNEL_HOOK_METHODS = (
+    'interpret', 'evaluate', 'execute_function', '_invoke_function',
+    'execute_body', 'execute_if', 'execute_for', '_interp_assignment', '_interp_return',
+    '_eval_binary_op', '_eval_compare', '_eval_logical', '_eval_unary',
+    '_eval_ternary', '_is_truthy',
+)
+_KERNEL_SAFE_CLASSES = {}
+_KERNEL_FALLBACK = object()
+
+
 class Interpreter:
     """Tree-walking interpreter for sauravcode ASTs.
 
@@ -2215,34 +3279,12 @@ class Interpreter:
         '%': operator.mod,
     }
     # Numeric-only dispatch with inline zero-checks for / and %.
-    # +, -, * go straight to the C-level operator with no branch overhead.
-    @staticmethod
-    def _safe_div(a, b):
-        if b == 0:
-            raise RuntimeError("Division by zero")
-        return a / b
-
-    @staticmethod
-    def _safe_mod(a, b):
-        if b == 0:
-            raise RuntimeError("Modulo by zero")
-        return a % b
-
-    _NUMERIC_OP_DISPATCH = {
-        '+': operator.add,
-        '-': operator.sub,
-        '*': operator.mul,
-        '/': _safe_div.__func__,
-        '%': _safe_mod.__func__,
-    }
-    _COMPARE_OP_DISPATCH = {
-        '==': operator.eq,
-        '!=': operator.ne,
-        '<':  operator.lt,
-        '>':  operator.gt,
-        '<=': operator.le,
-        '>=': operator.ge,
-    }
+    # BinaryOpNode carries its entry as ``_numeric_op``.
+    _safe_div = staticmethod(_safe_div)
+    _safe_mod = staticmethod(_safe_mod)
+    _NUMERIC_OP_DISPATCH = _NUMERIC_BINARY_OPS
+    # CompareNode carries its entry as ``_compare_op``.
+    _COMPARE_OP_DISPATCH = _COMPARE_OPS
 
     def __init__(self):
         self.functions = {}  # Store function definitions
@@ -2646,6 +3688,8 @@ class Interpreter:
         import re as _re
         import textwrap as _textwrap
 
+        _slug_re = _re.compile(r'[^a-z0-9]+')
+
         # -- 1-arg string builtins --
         _ONE_ARG_TABLE = {
             'str_reverse':  lambda s: s[::-1],
@@ -2655,7 +3699,7 @@ class Interpreter:
             'str_is_alpha': lambda s: len(s) > 0 and s.isalpha(),
             'str_is_alnum': lambda s: len(s) > 0 and s.isalnum(),
             'str_words':    lambda s: s.split(),
-            'str_slug':     lambda s: _re.sub(r'[^a-z0-9]+', '-', s.lower()).strip('-'),
+            'str_slug':     lambda s: _slug_re.sub('-', s.lower()).strip('-'),
         }
         for name, fn in _ONE_ARG_TABLE.items():
             def make_handler(n, f):
@@ -3990,16 +5034,16 @@ class Interpreter:
             interpreter._expect_args('re_test', args, 2)
             if not isinstance(args[0], str) or not isinstance(args[1], str):
                 raise RuntimeError("re_test: both arguments must be strings")
-            interpreter._regex_validate('re_test', args[0])
-            return bool(_re.search(args[0], args[1]))
+            regex = interpreter._regex_validate('re_test', args[0])
+            return bool(regex.search(args[1]))
 
         # re_match(pattern, text) -> map {matched, groups, start, end} or nil
         def _re_match(args):
             interpreter._expect_args('re_match', args, 2)
             if not isinstance(args[0], str) or not isinstance(args[1], str):
                 raise RuntimeError("re_match: both arguments must be strings")
-            interpreter._regex_validate('re_match', args[0])
-            m = _re.match(args[0], args[1])
+            regex = interpreter._regex_validate('re_match', args[0])
+            m = regex.match(args[1])
             if m is None:
                 return None
             return {
@@ -4014,8 +5058,8 @@ class Interpreter:
             interpreter._expect_args('re_search', args, 2)
             if not isinstance(args[0], str) or not isinstance(args[1], str):
                 raise RuntimeError("re_search: both arguments must be strings")
-            interpreter._regex_validate('re_search', args[0])
-            m = _re.search(args[0], args[1])
+            regex = interpreter._regex_validate('re_search', args[0])
+            m = regex.search(args[1])
             if m is None:
                 return None
             return {
@@ -4030,8 +5074,8 @@ class Interpreter:
             interpreter._expect_args('re_find_all', args, 2)
             if not isinstance(args[0], str) or not isinstance(args[1], str):
                 raise RuntimeError("re_find_all: both arguments must be strings")
-            interpreter._regex_validate('re_find_all', args[0])
-            results = _re.findall(args[0], args[1])
+            regex = interpreter._regex_validate('re_find_all', args[0])
+            results = regex.findall(args[1])
             # findall returns list of tuples when groups exist; convert to lists
             return [list(r) if isinstance(r, tuple) else r for r in results]
 
@@ -4041,11 +5085,11 @@ class Interpreter:
                 raise RuntimeError("re_replace expects 3-4 arguments: re_replace(pattern, replacement, text) or re_replace(pattern, replacement, text, count)")
             if not isinstance(args[0], str) or not isinstance(args[1], str) or not isinstance(args[2], str):
                 raise RuntimeError("re_replace: pattern, replacement, and text must be strings")
-            interpreter._regex_validate('re_replace', args[0])
+            regex = interpreter._regex_validate('re_replace', args[0])
             count = 0  # 0 means replace all
             if len(args) == 4:
                 count = int(args[3])
-            return _re.sub(args[0], args[1], args[2], count=count)
+            return regex.sub(args[1], args[2], count=count)
 
         # re_split(pattern, text) -> list of strings
         def _re_split(args):
@@ -4053,11 +5097,11 @@ class Interpreter:
                 raise RuntimeError("re_split expects 2-3 arguments: re_split(pattern, text) or re_split(pattern, text, maxsplit)")
             if not isinstance(args[0], str) or not isinstance(args[1], str):
                 raise RuntimeError("re_split: pattern and text must be strings")
-            interpreter._regex_validate('re_split', args[0])
+            regex = interpreter._regex_validate('re_split', args[0])
             maxsplit = 0
             if len(args) == 3:
                 maxsplit = int(args[2])
-            return _re.split(args[0], args[1], maxsplit=maxsplit)
+            return regex.split(args[1], maxsplit=maxsplit)
 
         # re_escape(text) -> escaped string safe for use in regex
         def _re_escape(args):
@@ -7011,9 +8055,11 @@ class Interpreter:
                 f"in function '{func_node.name}'"
             )
         result = None
-        # Inline scope push (avoids _scoped_env generator overhead)
+        # Inline scope push (avoids _scoped_env generator overhead), with
+        # the parameters bound in the local map as it is built.
         parent_vars = self.variables
-        self.variables = ChainMap({}, parent_vars)
+        self.variables = _chain_scope(dict(zip(func_node.params, evaluated_args)),
+                                      parent_vars)
         try:
             # Inject closure scope via ChainMap splicing — O(1) instead
             # of iterating all closure variables.  Uses getattr+None to
@@ -7029,8 +8075,6 @@ class Interpreter:
                 if closure_maps:
                     maps = self.variables.maps
                     self.variables = ChainMap(maps[0], *closure_maps, *maps[1:])
-            for param, val in zip(func_node.params, evaluated_args):
-                self.variables[param] = val
             try:
                 for stmt in func_node.body:
                     self.interpret(stmt)
@@ -8219,6 +9263,13 @@ class Interpreter:
         r'|(\([^)]*\{[^)]*\))[+*]'    # (X{N})+ etc.
     )
 
+    # Patterns that passed validation, compiled.  Programs tend to call the
+    # regex builtins in loops with the same literal pattern, so repeat
+    # calls skip the checks and the ``re`` module's own cache lookup.
+    # Cleared when full, like ``re``'s cache.
+    _REGEX_CACHE_MAX = 256
+    _regex_cache = {}
+
     def _regex_validate(self, func_name, pattern):
         """Validate a regex pattern for length and dangerous constructs.
 
@@ -8231,9 +9282,17 @@ class Interpreter:
             func_name: Name of the calling builtin (for error messages).
             pattern:   The regex pattern string.
 
+        Returns:
+            The compiled pattern.
+
         Raises:
             RuntimeError: On invalid, oversized, or dangerous pattern.
         """
+        cache = self._regex_cache
+        compiled = cache.get(pattern)
+        if compiled is not None:
+            return compiled
+
         if len(pattern) > self._REGEX_MAX_PATTERN_LEN:
             raise RuntimeError(
                 f"{func_name}: regex pattern too long "
@@ -8241,7 +9300,7 @@ class Interpreter:
             )
 
         try:
-            re.compile(pattern)
+            compiled = re.compile(pattern)
         except re.error as e:
             raise RuntimeError(f"{func_name}: invalid regex pattern: {e}")
 
@@ -8252,6 +9311,11 @@ class Interpreter:
                 f"exponential backtracking."
             )
 
+        if len(cache) >= self._REGEX_CACHE_MAX:
+            cache.clear()
+        cache[pattern] = compiled
+        return compiled
+
     def _builtin_regex_match(self, args):
         """regex_match(pattern, string) -> true if the entire string matches the pattern."""
         self._expect_args('regex_match', args, 2)
@@ -8260,8 +9324,8 @@ class Interpreter:
             raise RuntimeError("regex_match expects a string pattern as first argument")
         if not isinstance(string, str):
             raise RuntimeError("regex_match expects a string as second argument")
-        self._regex_validate('regex_match', pattern)
-        return re.fullmatch(pattern, string) is not None
+        regex = self._regex_validate('regex_match', pattern)
+        return regex.fullmatch(string) is not None
 
     def _builtin_regex_find(self, args):
         """regex_find(pattern, string) -> map with 'match', 'start', 'end', 'groups' or null."""
@@ -8271,8 +9335,8 @@ class Interpreter:
             raise RuntimeError("regex_find expects a string pattern as first argument")
         if not isinstance(string, str):
             raise RuntimeError("regex_find expects a string as second argument")
-        self._regex_validate('regex_find', pattern)
-        m = re.search(pattern, string)
+        regex = self._regex_validate('regex_find', pattern)
+        m = regex.search(string)
         if m is None:
             return None
         groups = list(m.groups()) if m.groups() else []
@@ -8291,8 +9355,8 @@ class Interpreter:
             raise RuntimeError("regex_find_all expects a string pattern as first argument")
         if not isinstance(string, str):
             raise RuntimeError("regex_find_all expects a string as second argument")
-        self._regex_validate('regex_find_all', pattern)
-        results = re.findall(pattern, string)
+        regex = self._regex_validate('regex_find_all', pattern)
+        results = regex.findall(string)
         # re.findall returns strings when no groups, tuples when groups
         # Convert tuples to lists for sauravcode consistency
         return [list(r) if isinstance(r, tuple) else r for r in results]
@@ -8307,8 +9371,8 @@ class Interpreter:
             raise RuntimeError("regex_replace expects a string replacement as second argument")
         if not isinstance(string, str):
             raise RuntimeError("regex_replace expects a string as third argument")
-        self._regex_validate('regex_replace', pattern)
-        return re.sub(pattern, replacement, string)
+        regex = self._regex_validate('regex_replace', pattern)
+        return regex.sub(replacement, string)
 
     def _builtin_regex_split(self, args):
         """regex_split(pattern, string) -> list of substrings split by pattern matches."""
@@ -8318,8 +9382,8 @@ class Interpreter:
             raise RuntimeError("regex_split expects a string pattern as first argument")
         if not isinstance(string, str):
             raise RuntimeError("regex_split expects a string as second argument")
-        self._regex_validate('regex_split', pattern)
-        return re.split(pattern, string)
+        regex = self._regex_validate('regex_split', pattern)
+        return regex.split(string)
 
     # --- JSON built-ins ---
     def _builtin_json_parse(self, args):
@@ -8519,7 +9583,7 @@ class Interpreter:
         much faster for programs with deep recursion or many calls.
         """
         parent = self.variables
-        self.variables = ChainMap({}, parent)
+        self.variables = _chain_scope({}, parent)
         try:
             yield
         finally:
@@ -8601,7 +9665,8 @@ class Interpreter:
 
     def _interp_yield(self, ast):
         result = self.evaluate(ast.expression)
-        debug(f"YieldNode evaluated with result: {result}\n")
+        if DEBUG:
+            debug(f"YieldNode evaluated with result: {result}\n")
         raise YieldSignal(result)
 
     # ── Value → string formatting dispatch (shared by print + f-strings) ──
@@ -8744,13 +9809,18 @@ class Interpreter:
         return enum_map[node.variant_name]
 
     def execute_if(self, node):
-        """Execute if / else if / else statements."""
+        """Execute if / else if / else statements.
+
+        Comparisons and logical operators produce a bare bool, which is
+        used as-is; only other condition values go through _is_truthy.
+        """
         condition = self.evaluate(node.condition)
-        if self._is_truthy(condition):
+        if condition is True or (condition is not False and self._is_truthy(condition)):
             self.execute_body(node.body)
             return
         for elif_cond, elif_body in node.elif_chains:
-            if self._is_truthy(self.evaluate(elif_cond)):
+            condition = self.evaluate(elif_cond)
+            if condition is True or (condition is not False and self._is_truthy(condition)):
                 self.execute_body(elif_body)
                 return
         if node.else_body:
@@ -8771,7 +9841,11 @@ class Interpreter:
         _condition = node.condition
         _body = node.body
         _max = MAX_LOOP_ITERATIONS
-        while _is_truthy(_evaluate(_condition)):
+        while True:
+            # A bool condition (the usual comparison) skips _is_truthy.
+            condition = _evaluate(_condition)
+            if condition is not True and (condition is False or not _is_truthy(condition)):
+                break
             iterations += 1
             if iterations > _max:
                 raise RuntimeError(
@@ -8799,6 +9873,14 @@ class Interpreter:
                 f"For loop range ({abs(end - start):,}) exceeds maximum "
                 f"iterations ({MAX_LOOP_ITERATIONS:,})"
             )
+        # Numeric bodies run as one compiled loop when possible.
+        kernel = node._kernel
+        if kernel is None:
+            kernel = node._kernel = _compile_loop_kernel(node, self.variables,
+                                                         self.functions)
+        if (kernel and self._kernels_enabled()
+                and self._run_loop_kernel(kernel, start, end) is not _KERNEL_FALLBACK):
+            return
         _variables = self.variables
         _var = node.var
         _execute_body = self.execute_body
@@ -8988,8 +10070,7 @@ class Interpreter:
         self._source_dir = os.path.dirname(full_path)
         
         try:
-            tokens = list(tokenize(code))
-            parser = Parser(tokens)
+            parser = Parser(iter_tokens(code))
             ast_nodes = parser.parse()
             
             # Execute module in an isolated scope (issue #13).
@@ -9004,9 +10085,9 @@ class Interpreter:
                 self.interpret(stmt)
 
             # Collect all functions defined/overwritten by the module
-            module_functions = dict(self.functions)
+            module_functions = _snapshot_scope(self.functions)
             # Collect all variables defined by the module
-            module_vars = dict(self.variables)
+            module_vars = _snapshot_scope(self.variables)
 
             # Attach the module scope as a closure on each function defined
             # in this module, so they can reference module-level variables
@@ -9090,55 +10171,282 @@ class Interpreter:
                 f"in function '{name}'"
             )
 
+        # A body ending in ``return <self-call>`` loops here instead of
+        # recursing, so tail recursion runs in constant Python stack.  It
+        # is bounded like any other loop rather than by the call depth.
+        tail_call = func_node._tail_call
+        if tail_call is None:
+            tail_call = func_node._tail_call = (
+                not self._has_yield(func_node.body) and _find_tail_call(func_node))
+        if tail_call and (getattr(func_node, 'closure_scope', None)
+                          or not self._kernels_enabled()):
+            tail_call = False
+
         result = None
-        # Inline scope push (replaces ``with self._scoped_env():``)
         parent_vars = self.variables
-        self.variables = ChainMap({}, parent_vars)
+        # The parameters are bound in the new local map as it is built;
+        # writing them through ChainMap.__setitem__ costs a Python-level
+        # call each.
+        local = dict(zip(func_node.params, evaluated_args))
+        tail_iterations = 0
         try:
-            # Inject closure scope by splicing its maps into the ChainMap
-            # chain — O(1) instead of iterating all closure variables.
-            # The local scope (maps[0]) stays on top so params and local
-            # writes shadow closure variables correctly.
-            cs = getattr(func_node, 'closure_scope', None)
-            if cs:
-                # Extract the underlying maps from the closure ChainMap and
-                # insert them between the local scope and the parent scope.
-                # Using getattr+None avoids the hasattr double-lookup, and
-                # pre-building the maps list avoids repeated tuple unpacking.
-                if isinstance(cs, ChainMap):
-                    closure_maps = cs.maps
-                elif isinstance(cs, dict):
-                    closure_maps = [cs]
-                else:
-                    closure_maps = []
-                if closure_maps:
-                    maps = self.variables.maps
-                    self.variables = ChainMap(maps[0], *closure_maps, *maps[1:])
+            while True:
+                # Inline scope push (replaces ``with self._scoped_env():``).
+                self.variables = _chain_scope(local, parent_vars)
+
+                # Inject closure scope by splicing its maps into the ChainMap
+                # chain — O(1) instead of iterating all closure variables.
+                # The local scope (maps[0]) stays on top so params and local
+                # writes shadow closure variables correctly.
+                cs = getattr(func_node, 'closure_scope', None)
+                if cs:
+                    # Extract the underlying maps from the closure ChainMap and
+                    # insert them between the local scope and the parent scope.
+                    # Using getattr+None avoids the hasattr double-lookup, and
+                    # pre-building the maps list avoids repeated tuple unpacking.
+                    if isinstance(cs, ChainMap):
+                        closure_maps = cs.maps
+                    elif isinstance(cs, dict):
+                        closure_maps = [cs]
+                    else:
+                        closure_maps = []
+                    if closure_maps:
+                        maps = self.variables.maps
+                        self.variables = ChainMap(maps[0], *closure_maps, *maps[1:])
 
-            for param, arg_val in zip(func_node.params, evaluated_args):
-                self.variables[param] = arg_val
                 if DEBUG:
-                    debug(f"Set parameter '{param}' to {arg_val}")
-            try:
-                for stmt in func_node.body:
-                    self.interpret(stmt)
-            except ReturnSignal as ret:
-                result = ret.value
-            finally:
-                self._call_depth -= 1
+                    for param, arg_val in zip(func_node.params, evaluated_args):
+                        debug(f"Set parameter '{param}' to {arg_val}")
+                try:
+                    body = func_node.body
+                    if tail_call:
+                        for index in range(len(body) - 1):
+                            self.interpret(body[index])
+                        # The name is looked up when the call is reached,
+                        # as execute_function would.
+                        if self.functions.get(tail_call.name) is func_node:
+                            evaluated_args = self._eval_tail_call_args(tail_call)
+                            tail_iterations += 1
+                            if tail_iterations > MAX_LOOP_ITERATIONS:
+                                raise RuntimeError(
+                                    f"Maximum loop iterations ({MAX_LOOP_ITERATIONS:,}) "
+                                    f"exceeded in tail calls of function '{name}'"
+                                )
+                            # A real call would see this call's locals
+                            # behind its parameters; one merged map gives
+                            # the same lookups without growing the chain.
+                            local = dict(local)
+                            local.update(zip(func_node.params, evaluated_args))
+                            continue
+                        self.interpret(body[-1])
+                    else:
+                        for stmt in body:
+                            self.interpret(stmt)
+                except ReturnSignal as ret:
+                    result = ret.value
+                break
         finally:
+            self._call_depth -= 1
             # Inline scope pop (replaces _scoped_env finally block)
             self.variables = parent_vars
         if DEBUG:
             debug(f"Function {name} returned {result}\n")
         return result
 
+    def _eval_tail_call_args(self, call_node):
+        """Evaluate the arguments of a tail self-call found by _find_tail_call.
+
+        Matches evaluate() on *call_node*: the call counts as one level of
+        expression nesting, and a plain RuntimeError is reported at the
+        call's line.
+        """
+        self._eval_depth += 1
+        try:
+            if self._eval_depth > MAX_EVAL_DEPTH:
+                raise SauravRuntimeError(
+                    f"Maximum expression nesting depth ({MAX_EVAL_DEPTH}) exceeded",
+                    line=getattr(call_node, 'line_num', None)
+                )
+            const_args = call_node._const_args
+            if const_args is not None:
+                return list(const_args)
+            return [self.evaluate(arg) for arg in call_node.arguments]
+        except SauravRuntimeError:
+            raise
+        except (ReturnSignal, ThrowSignal, BreakSignal, ContinueSignal, YieldSignal):
+            raise
+        except RuntimeError as e:
+            line = getattr(call_node, 'line_num', None)
+            raise SauravRuntimeError(str(e), line=line) from None
+        finally:
+            self._eval_depth -= 1
+
+    def _kernels_enabled(self):
+        """Return True if numeric kernels may replace tree-walking here.
+
+        Subclasses or instances that hook statement/expression execution
+        (debugger, tracer, coverage, profiler) must observe every node, so
+        kernels are only used on a plain Interpreter.
+        """
+        if DEBUG:
+            return False
+        cls = type(self)
+        safe = _KERNEL_SAFE_CLASSES.get(cls)
+        if safe is None:
+            safe = all(getattr(cls, m) is getattr(Interpreter, m)
+                       for m in _KERNEL_HOOK_METHODS)
+            _KERNEL_SAFE_CLASSES[cls] = safe
+        if not safe:
+            return False
+        d = self.__dict__
+        return not ('interpret' in d or 'evaluate' in d
+                    or 'execute_function' in d or '_invoke_function' in d)
+
+    def _run_kernel(self, kernel, args):
+        """Call a numeric kernel, or return _KERNEL_FALLBACK.
+
+        Falls back when an argument is not an int/float, the arity does
+        not match, the call would trip the recursion or expression-depth
+        guard, a called builtin is shadowed by a user function, or the
+        kernel raises (division by zero, ``sqrt`` of a negative, ...).  The
+        tree-walker then produces the exact original result or error.
+        """
+        if (len(args) != kernel.arity
+                or self._call_depth >= MAX_RECURSION_DEPTH
+                or self._eval_depth + kernel.eval_depth > MAX_EVAL_DEPTH):
+            return _KERNEL_FALLBACK
+        for arg in args:
+            arg_type = type(arg)
+            if arg_type is not float and arg_type is not int:
+                return _KERNEL_FALLBACK
+        for name in kernel.builtins:
+            # A user function of the same name takes precedence over the builtin.
+            if name in self.functions:
+                return _KERNEL_FALLBACK
+        try:
+            return kernel.fn(self.builtins, self._kernel_call, *args)
+        except Exception:
+            return _KERNEL_FALLBACK
+
+    def _kernel_call(self, name, depth, args):
+        """Call user function *name* from inside a kernel.
+
+        Runs the callee's kernel with the call and expression depth the
+        tree-walker would have reached at the call site (*depth* nodes
+        into the caller's expression).  Raises _KernelUnsupported if the
+        function was redefined without a kernel or its kernel falls back,
+        so the calling kernel falls back as a whole.
+        """
+        kernel = getattr(self.functions.get(name), '_kernel', None)
+        if not kernel:
+            raise _KernelUnsupported(name)
+        self._call_depth += 1
+        self._eval_depth += depth
+        try:
+            result = self._run_kernel(kernel, args)
+        finally:
+            self._call_depth -= 1
+            self._eval_depth -= depth
+        if result is _KERNEL_FALLBACK:
+            raise _KernelUnsupported(name)
+        return result
+
+    def _run_loop_kernel(self, kernel, start, end):
+        """Run a ``for`` loop kernel, or return _KERNEL_FALLBACK.
+
+        Falls back, leaving every variable as it was, when an input is
+        unset or not an int/float, a called builtin is shadowed, the body
+        could hit the expression-depth guard, or the kernel raises.
+        """
+        if self._eval_depth + kernel.eval_depth > MAX_EVAL_DEPTH:
+            return _KERNEL_FALLBACK
+        variables = self.variables
+        args = []
+        for name in kernel.inputs:
+            value = _scope_get(variables, name, _KERNEL_FALLBACK)
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                return _KERNEL_FALLBACK
+            args.append(value)
+        for name in kernel.builtins:
+            if name in self.functions:
+                return _KERNEL_FALLBACK
+        try:
+            results = kernel.fn(self.builtins, self._kernel_call, start, end, *args)
+        except Exception:
+            return _KERNEL_FALLBACK
+        for name, value in zip(kernel.outputs, results):
+            if value is not _KERNEL_UNSET:
+                variables[name] = value
+        return None
+
+    def _run_expr_kernel(self, kernel):
+        """Evaluate an arithmetic expression kernel, or return _KERNEL_FALLBACK.
+
+        Falls back when a variable is unset or not an int/float, when the
+        tree-walker could hit the expression-depth guard, or when the
+        kernel raises; re-walking the (side-effect free) tree then gives
+        the original result or error.
+        """
+        if self._eval_depth + kernel.eval_depth > MAX_EVAL_DEPTH:
+            return _KERNEL_FALLBACK
+        variables = self.variables
+        maps = variables.maps if type(variables) is ChainMap else (variables,)
+        args = []
+        for name in kernel.names:
+            # _scope_get inlined: this runs on every evaluation.
+            for mapping in maps:
+                if name in mapping:
+                    value = mapping[name]
+                    break
+            else:
+                return _KERNEL_FALLBACK
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                return _KERNEL_FALLBACK
+            args.append(value)
+        try:
+            return kernel.fn(*args)
+        except Exception:
+            return _KERNEL_FALLBACK
+
+    def _memo_key(self, memo, func, args):
+        """Return the memo key for calling *func* with *args*, or None.
+
+        The key pairs each argument with its type so ``1`` and ``1.0``
+        stay distinct.  Returns None (call normally) when an argument is
+        not a number or string, the arity does not match (missing
+        parameters would be looked up in the caller's scope), the call
+        would trip the recursion guard, or a builtin the body calls is
+        shadowed by a user function.
+        """
+        if (len(args) != len(func.params)
+                or self._call_depth >= MAX_RECURSION_DEPTH):
+            return None
+        key = []
+        for arg in args:
+            arg_type = type(arg)
+            if arg_type not in _MEMO_KEY_TYPES:
+                return None
+            key.append(arg_type)
+            key.append(arg)
+        for name in memo.builtins:
+            if name in self.functions:
+                return None
+        return tuple(key)
+
     def execute_function(self, call_node):
         name = call_node.name
 
         # Evaluate arguments once — all code paths need the same values
-        # and sauravcode has no lazy-evaluation semantics.
-        evaluated_args = [self.evaluate(arg) for arg in call_node.arguments]
+        # and sauravcode has no lazy-evaluation semantics.  Literal-only
+        # argument lists were already collected when the node was built;
+        # they are copied because builtins receive a list they may modify.
+        const_args = call_node._const_args
+        if const_args is not None:
+            evaluated_args = list(const_args)
+        else:
+            evaluated_args = [self.evaluate(arg) for arg in call_node.arguments]
 
         # Check user-defined functions first (allows overriding builtins)
         func = self.functions.get(name)
@@ -9155,9 +10463,37 @@ class Interpreter:
                 is_gen = self._has_yield(func.body)
                 func._is_generator = is_gen
             if is_gen:
-                debug(f"Function {name} is a generator — returning GeneratorValue")
+                if DEBUG:
+                    debug(f"Function {name} is a generator — returning GeneratorValue")
                 return GeneratorValue(self, func, evaluated_args)
 
+            # Pure numeric functions run as a compiled kernel when possible.
+            kernel = getattr(func, '_kernel', None)
+            if kernel is None:
+                kernel = func._kernel = _compile_numeric_kernel(func, self.functions)
+            if kernel and self._kernels_enabled():
+                result = self._run_kernel(kernel, evaluated_args)
+                if result is not _KERNEL_FALLBACK:
+                    return result
+
+            # Pure self-recursive functions reuse results for repeated arguments.
+            memo = getattr(func, '_memo', None)
+            if memo is None:
+                memo = func._memo = _compile_call_memo(func)
+            if memo and self._kernels_enabled():
+                key = self._memo_key(memo, func, evaluated_args)
+                if key is not None:
+                    results = memo.results
+                    result = results.get(key, _KERNEL_FALLBACK)
+                    if result is _KERNEL_FALLBACK:
+                        result = self._invoke_function(func, evaluated_args, name)
+                        results[key] = result
+                        if len(results) > _MEMO_MAX_ENTRIES:
+                            results.popitem(last=False)
+                    else:
+                        results.move_to_end(key)
+                    return result
+
             return self._invoke_function(func, evaluated_args, name)
 
         # Check built-in functions — single dict lookup instead of
@@ -9203,9 +10539,18 @@ class Interpreter:
         if node_type is BoolNode:
             return node.value
         if node_type is IdentifierNode:
-            value = self.variables.get(node.name, self._SENTINEL)
-            if value is not self._SENTINEL:
-                return value
+            variables = self.variables
+            if type(variables) is ChainMap:
+                # Inside a function: probe the scope maps directly, as
+                # _scope_get does, without the extra call.
+                name = node.name
+                for mapping in variables.maps:
+                    if name in mapping:
+                        return mapping[name]
+            else:
+                value = variables.get(node.name, self._SENTINEL)
+                if value is not self._SENTINEL:
+                    return value
             # Fall through to full path for function/builtin lookups
             return self._eval_identifier(node)
 
@@ -9254,7 +10599,7 @@ class Interpreter:
         # of ``name in self.variables`` followed by ``self.variables[name]``.
         # For programs with deeply nested scopes this cuts identifier
         # resolution cost roughly in half on the hot path.
-        value = self.variables.get(node.name, self._SENTINEL)
+        value = _scope_get(self.variables, node.name, self._SENTINEL)
         if value is not self._SENTINEL:
             if DEBUG:
                 debug(f"Identifier '{node.name}' is a variable with value {value}")
@@ -9268,7 +10613,7 @@ class Interpreter:
             # reference — significant in programs that pass functions to
             # map/filter/reduce in tight loops.
             return _BoundFunction(
-                self.functions[node.name], ChainMap({}, self.variables)
+                self.functions[node.name], _chain_scope({}, self.variables)
             )
         elif node.name in self.builtins:
             if DEBUG:
@@ -9278,18 +10623,31 @@ class Interpreter:
             raise RuntimeError(f"Name '{node.name}' is not defined.")
 
     def _eval_binary_op(self, node):
+        # Whole arithmetic trees run as a compiled expression kernel.
+        kernel = node._kernel
+        if kernel is None:
+            kernel = node._kernel = _compile_expr_kernel(node)
+        if kernel and self._kernels_enabled():
+            result = self._run_expr_kernel(kernel)
+            if result is not _KERNEL_FALLBACK:
+                return result
         left = self.evaluate(node.left)
         right = self.evaluate(node.right)
         if DEBUG:
             debug(f"Performing operation: {left} {node.operator} {right}")
         op = node.operator
         try:
-            # Fast path: both operands are numbers — pure dispatch, no guards needed.
-            # This avoids isinstance checks on the hot path for arithmetic-heavy code.
-            # Division/modulo zero-checks are embedded in the dispatch lambdas
-            # (_NUMERIC_OP_DISPATCH) so +, -, * avoid the branch entirely.
+            # Fast path: both operands are numbers — call the operator
+            # function the node resolved at parse time, no guards needed.
+            # Division/modulo zero-checks are embedded in those functions
+            # (_NUMERIC_BINARY_OPS) so +, -, * avoid the branch entirely.
             if isinstance(left, (int, float)) and isinstance(right, (int, float)):
-                return self._NUMERIC_OP_DISPATCH[op](left, right)
+                return node._numeric_op(left, right)
+
+            # +, - (string concat, list concat, etc.) need no guards either.
+            op_fn = node._generic_op
+            if op_fn is not None:
+                return op_fn(left, right)
 
             # Repetition guard for string/list * int
             if op == '*':
@@ -9309,10 +10667,6 @@ class Interpreter:
                     raise RuntimeError("Modulo by zero")
                 return left % right
 
-            # O(1) dispatch for +, - (handles string concat, list concat, etc.)
-            op_fn = self._BINARY_OP_DISPATCH.get(op)
-            if op_fn is not None:
-                return op_fn(left, right)
             raise ValueError(f'Unknown operator: {op}')
         except TypeError:
             raise RuntimeError(
@@ -9321,12 +10675,19 @@ class Interpreter:
             )
 
     def _eval_compare(self, node):
+        kernel = node._kernel
+        if kernel is None:
+            kernel = node._kernel = _compile_expr_kernel(node)
+        if kernel and self._kernels_enabled():
+            result = self._run_expr_kernel(kernel)
+            if result is not _KERNEL_FALLBACK:
+                return result
         left = self.evaluate(node.left)
         right = self.evaluate(node.right)
         if DEBUG:
             debug(f"Comparing: {left} {node.operator} {right}")
         try:
-            cmp_fn = self._COMPARE_OP_DISPATCH.get(node.operator)
+            cmp_fn = node._compare_op
             if cmp_fn is not None:
                 return cmp_fn(left, right)
             raise ValueError(f'Unknown comparison operator: {node.operator}')
@@ -9341,21 +10702,37 @@ class Interpreter:
 
         Hoists _is_truthy to a local to avoid repeated LOAD_ATTR on the
         hot path.  For deeply nested boolean expressions this saves one
-        attribute lookup per node.
+        attribute lookup per node.  Bool operands, which comparisons and
+        nested and/or produce, are used without calling it.
         """
+        kernel = node._kernel
+        if kernel is None:
+            kernel = node._kernel = _compile_expr_kernel(node)
+        if kernel and self._kernels_enabled():
+            result = self._run_expr_kernel(kernel)
+            if result is not _KERNEL_FALLBACK:
+                return result
         _truthy = self._is_truthy
         left = self.evaluate(node.left)
+        if type(left) is not bool:
+            left = _truthy(left)
         op = node.operator
         if op == 'and':
-            return _truthy(left) and _truthy(self.evaluate(node.right))
+            if not left:
+                return False
         elif op == 'or':
-            return _truthy(left) or _truthy(self.evaluate(node.right))
+            if left:
+                return True
         else:
             raise ValueError(f'Unknown logical operator: {op}')
+        right = self.evaluate(node.right)
+        return right if type(right) is bool else _truthy(right)
 
     def _eval_unary(self, node):
         operand = self.evaluate(node.operand)
         if node.operator == 'not':
+            if type(operand) is bool:
+                return not operand
             return not self._is_truthy(operand)
         elif node.operator == '-':
             return -operand
@@ -9363,6 +10740,11 @@ class Interpreter:
             raise ValueError(f'Unknown unary operator: {node.operator}')
 
     def _eval_list(self, node):
+        values = node._values
+        if values is None:
+            values = node._values = _literal_values(node.elements)
+        if values and self._kernels_enabled():
+            return values.copy()
         return [self.evaluate(e) for e in node.elements]
 
     def _eval_list_comprehension(self, node):
@@ -9485,14 +10867,13 @@ class Interpreter:
         definition time (not a live reference), so that later mutations
         to the outer scope don't affect the lambda's closed-over values.
 
-        Uses ``dict(self.variables)`` instead of ``self.variables.copy()``
-        because when ``self.variables`` is a ``ChainMap`` (common during
-        nested function calls), ``dict()`` flattens it in one C-level
-        pass while ``.copy()`` returns another ``ChainMap`` whose
-        ``__iter__`` must walk the full chain.  For a 3-deep ChainMap
-        with ~50 variables, ``dict()`` is ~2x faster.
+        The snapshot is a flat dict built by ``_snapshot_scope()``: when
+        ``self.variables`` is a ``ChainMap`` (inside any function call)
+        its maps are merged with ``dict.update`` instead of copying key
+        by key through the ChainMap, so later lookups in the closure are
+        single dict probes.
         """
-        return LambdaValue(node.params, node.body_expr, dict(self.variables))
+        return LambdaValue(node.params, node.body_expr, _snapshot_scope(self.variables))
 
     def _call_lambda(self, lam, args):
         """Call a LambdaValue with the given arguments.
@@ -9513,9 +10894,7 @@ class Interpreter:
         # Save and restore variables manually (skip _scoped_env which
         # would create an unused intermediate ChainMap).
         saved = self.variables
-        self.variables = ChainMap({}, lam.closure)
-        for param, val in zip(lam.params, args):
-            self.variables[param] = val
+        self.variables = _chain_scope(dict(zip(lam.params, args)), lam.closure)
         try:
             return self.evaluate(lam.body_expr)
         finally:
@@ -9924,8 +11303,7 @@ def repl():
 
 def _repl_execute(code, interpreter):
     """Parse and execute code in the REPL context."""
-    tokens = list(tokenize(code))
-    parser = Parser(tokens)
+    parser = Parser(iter_tokens(code))
     ast_nodes = parser.parse()
 
     for node in ast_nodes:
@@ -9988,11 +11366,10 @@ def main():
         sys.exit(1)
     
     # Tokenize and parse multiple top-level statements
-    tokens = list(tokenize(code))
+    parser = Parser(iter_tokens(code))
     if DEBUG:
-        debug(f"\nTokens: {tokens}\n")
+        debug(f"\nTokens: {parser.tokens}\n")
 
-    parser = Parser(tokens)
     ast_nodes = parser.parse()
     if DEBUG:
         debug(f"\nAST: {ast_nodes}\n")
@@ -48,7 +48,7 @@ if _HERE not in sys.path:
     sys.path.insert(0, _HERE)
 
 from saurav import (  # noqa: E402
-    tokenize, Parser, Interpreter, ThrowSignal,
+    iter_tokens, Parser, Interpreter, ThrowSignal,
     ReturnSignal,
 )
 
@@ -64,8 +64,7 @@ def load_srv(path):
         code = f.read()
     if not code.endswith("\n"):
         code += "\n"
-    tokens = list(tokenize(code))
-    parser = Parser(tokens)
+    parser = Parser(iter_tokens(code))
     ast_nodes = parser.parse()
     interp = Interpreter()
     for node in ast_nodes:
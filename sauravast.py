@@ -20,7 +20,7 @@ import argparse
 from collections import Counter
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 
 # == Encoding helpers ================================================
@@ -50,7 +50,7 @@ def _node_children(node):
     skipped so that downstream consumers see only the structural slots.
     """
     pairs = []
-    for attr in sorted(vars(node)):
+    for attr in sorted(node_vars(node)):
         if attr.startswith('_') or attr == 'line_num':
             continue
         pairs.append((attr, getattr(node, attr)))
@@ -27,7 +27,7 @@ from contextlib import redirect_stdout, redirect_stderr
 
 # Import the sauravcode interpreter
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, Interpreter, FunctionCallNode
+from saurav import iter_tokens, Parser, Interpreter, FunctionCallNode
 
 
 # -- Constants ----------------------------------------------------
@@ -43,8 +43,7 @@ REGRESSION_THRESHOLD = 0.10  # 10% slower = regression
 
 def parse_once(code):
     """Tokenize and parse code once, returning reusable AST nodes."""
-    tokens = list(tokenize(code))
-    parser = Parser(tokens)
+    parser = Parser(iter_tokens(code))
     return parser.parse()
 
 
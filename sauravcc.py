@@ -41,31 +41,38 @@ token_specification = [
     ('NUMBER',   r'\d+(\.\d*)?'),
     ('FSTRING',  r'f\"(?:[^\"\\]|\\.)*\"'),   # f-string: f"..." (must come before STRING)
     ('STRING',   r'\"(?:[^\"\\]|\\.)*\"'),     # String with escape support
-    ('EQ',       r'=='),
-    ('NEQ',      r'!='),
-    ('LTE',      r'<='),
-    ('GTE',      r'>='),
-    ('LT',       r'<'),
-    ('GT',       r'>'),
-    ('ASSIGN',   r'='),
-    ('OP',       r'[+\-*/%]'),                # Added modulo
-    ('LPAREN',   r'\('),
-    ('RPAREN',   r'\)'),
-    ('LBRACKET', r'\['),
-    ('RBRACKET', r'\]'),
-    ('LBRACE',   r'\{'),
-    ('RBRACE',   r'\}'),
-    ('COLON',    r':'),
-    ('DOT',      r'\.'),
-    ('COMMA',    r','),
+    # Operators and punctuation share one alternative; _PUNCT_TYPES maps the
+    # matched text back to its token type.  Two-character operators come
+    # first so '==' is never split into two ASSIGNs.
+    ('PUNCT',    r'==|!=|<=|>=|[<>=+\-*/%()\[\]{}:.,]'),
     ('IDENT',    r'[a-zA-Z_]\w*'),  # Keywords resolved via _CC_KEYWORDS post-match
-    ('NEWLINE',  r'\n'),
-    ('SKIP',     r'[ \t]+'),
-    ('MISMATCH', r'.'),
+    ('NEWLINE',  r'\n[ \t]*'),  # Newline plus the next line's indentation
+    ('MISMATCH', r'[^ \t\n]'),
 ]
 
-tok_regex = re.compile('|'.join(f'(?P<{pair[0]}>{pair[1]})' for pair in token_specification))
-_indent_re = re.compile(r'[ \t]*')
+# Token type for each operator / punctuation string matched by PUNCT.
+_PUNCT_TYPES = {
+    '==': 'EQ', '!=': 'NEQ', '<=': 'LTE', '>=': 'GTE', '<': 'LT', '>': 'GT',
+    '=': 'ASSIGN', '+': 'OP', '-': 'OP', '*': 'OP', '/': 'OP', '%': 'OP',
+    '(': 'LPAREN', ')': 'RPAREN', '[': 'LBRACKET', ']': 'RBRACKET',
+    '{': 'LBRACE', '}': 'RBRACE', ':': 'COLON', '.': 'DOT', ',': 'COMMA',
+}
+
+# Spaces and tabs between tokens are consumed by the same match as the
+# token that follows them (before the named group), as in the interpreter's
+# tokenizer, so no whitespace-only match is produced just to be skipped.
+tok_regex = re.compile(r'[ \t]*(?:'
+                       + '|'.join(f'(?P<{pair[0]}>{pair[1]})' for pair in token_specification)
+                       + ')')
+
+# Token type for each group, indexed by ``match.lastindex``: a list index
+# instead of the name lookups behind ``match.lastgroup`` / ``group(name)``.
+# Group names on a compiled pattern are not interned, so they are interned
+# here; see _CC_KEYWORD_VALUES below.
+_GROUP_TOKEN_TYPES = [None] * (tok_regex.groups + 1)
+for _name, _index in tok_regex.groupindex.items():
+    _GROUP_TOKEN_TYPES[_index] = sys.intern(_name)
+del _name, _index
 
 # Keyword set for O(1) post-match reclassification.
 # Replacing the 30+ alternation KEYWORD regex pattern with a frozenset lookup
@@ -79,65 +86,72 @@ _CC_KEYWORDS = frozenset({
     'assert', 'enum',
 })
 
+# Token types and keyword values are emitted as interned strings, as in
+# the interpreter's tokenizer, so the parser's ``== 'NEWLINE'`` /
+# ``== 'function'`` checks against literals succeed on the identity fast
+# path instead of comparing characters.
+_CC_KEYWORD_VALUES = {kw: sys.intern(kw) for kw in _CC_KEYWORDS}
+
 
 def tokenize(code):
     tokens = []
+    append = tokens.append  # bound once; called for every token
     line_num = 1
     line_start = 0
     indent_levels = [0]
 
     for match in tok_regex.finditer(code):
-        typ = match.lastgroup
-        value = match.group(typ)
+        index = match.lastindex
+        typ = _GROUP_TOKEN_TYPES[index]
+        if typ == 'COMMENT':
+            continue
+        value = match.group(index)
 
         if typ == 'NEWLINE':
+            # The NEWLINE pattern also consumes the next line's leading
+            # whitespace, so the indentation is read from the match itself
+            # rather than by a second regex scan at line_start.
+            newline_pos = match.start(index)
             line_num += 1
-            line_start = match.end()
-            tokens.append(('NEWLINE', value, line_num, match.start()))
-
-            indent_match = _indent_re.match(code, line_start)
-            if indent_match:
-                indent_str = indent_match.group(0)
-                indent = len(indent_str.replace('\t', '    '))
-                if indent > indent_levels[-1]:
-                    indent_levels.append(indent)
-                    tokens.append(('INDENT', indent, line_num, line_start))
-                while indent < indent_levels[-1]:
-                    indent_levels.pop()
-                    tokens.append(('DEDENT', indent, line_num, line_start))
-
-        elif typ == 'SKIP':
-            continue
-        elif typ == 'COMMENT':
-            continue
+            line_start = newline_pos + 1
+            append(('NEWLINE', '\n', line_num, newline_pos))
+
+            indent = len(value) - 1
+            if '\t' in value:
+                indent += 3 * value.count('\t')  # tab = 4 spaces
+            if indent > indent_levels[-1]:
+                indent_levels.append(indent)
+                append(('INDENT', indent, line_num, line_start))
+            while indent < indent_levels[-1]:
+                indent_levels.pop()
+                append(('DEDENT', indent, line_num, line_start))
+
         elif typ == 'MISMATCH':
             raise RuntimeError(f'Unexpected character {value!r} on line {line_num}')
         else:
-            # Reclassify identifiers that are keywords via O(1) set lookup.
-            if typ == 'IDENT' and value in _CC_KEYWORDS:
-                typ = 'KEYWORD'
-            column = match.start() - line_start
-            tokens.append((typ, value, line_num, column))
+            if typ == 'PUNCT':
+                typ = _PUNCT_TYPES[value]
+            elif typ == 'IDENT':
+                # Reclassify identifiers that are keywords via O(1) dict
+                # lookup, which also yields the interned keyword string.
+                keyword = _CC_KEYWORD_VALUES.get(value)
+                if keyword is not None:
+                    typ = 'KEYWORD'
+                    value = keyword
+                    # Merge KEYWORD('else') + KEYWORD('if') into KEYWORD('else if')
+                    # as they are emitted, rather than in a second pass over the
+                    # whole token list.
+                    if value == 'if' and tokens:
+                        prev = tokens[-1]
+                        if prev[0] == 'KEYWORD' and prev[1] == 'else':
+                            tokens[-1] = ('KEYWORD', 'else if', prev[2], prev[3])
+                            continue
+            column = match.start(index) - line_start
+            append((typ, value, line_num, column))
 
     while len(indent_levels) > 1:
         indent_levels.pop()
-        tokens.append(('DEDENT', 0, line_num, line_start))
-
-    # Merge adjacent KEYWORD('else') + KEYWORD('if') into KEYWORD('else if')
-    # to match the old single-token behaviour expected by the parser.
-    merged = []
-    i = 0
-    n = len(tokens)
-    while i < n:
-        tok = tokens[i]
-        if (tok[0] == 'KEYWORD' and tok[1] == 'else' and
-                i + 1 < n and tokens[i + 1][0] == 'KEYWORD' and tokens[i + 1][1] == 'if'):
-            merged.append(('KEYWORD', 'else if', tok[2], tok[3]))
-            i += 2
-        else:
-            merged.append(tok)
-            i += 1
-    tokens = merged
+        append(('DEDENT', 0, line_num, line_start))
 
     return tokens
 
@@ -147,9 +161,14 @@ def tokenize(code):
 # ============================================================
 
 class ASTNode:
+    # Nodes use __slots__ (no per-instance __dict__): ASTs stay compact and
+    # attribute loads in the code generator are fixed slot offsets.
+    __slots__ = ()
+
     def children(self):
         """Yield all child ASTNode instances for generic tree walking."""
-        for val in self.__dict__.values():
+        for name in self.__slots__:
+            val = getattr(self, name)
             if isinstance(val, ASTNode):
                 yield val
             elif isinstance(val, list):
@@ -166,29 +185,41 @@ class ASTNode:
                                         yield sub
 
 class ProgramNode(ASTNode):
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements
 
 class AssignmentNode(ASTNode):
+    __slots__ = ('name', 'expression')
+
     def __init__(self, name, expression):
         self.name = name
         self.expression = expression
 
 class FunctionNode(ASTNode):
+    __slots__ = ('name', 'params', 'body')
+
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
         self.body = body
 
 class ReturnNode(ASTNode):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
 class PrintNode(ASTNode):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
 class IfNode(ASTNode):
+    __slots__ = ('condition', 'body', 'elif_chains', 'else_body')
+
     def __init__(self, condition, body, elif_chains=None, else_body=None):
         self.condition = condition
         self.body = body
@@ -196,11 +227,15 @@ class IfNode(ASTNode):
         self.else_body = else_body
 
 class WhileNode(ASTNode):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
 
 class ForNode(ASTNode):
+    __slots__ = ('var', 'start', 'end', 'body')
+
     def __init__(self, var, start, end, body):
         self.var = var
         self.start = start
@@ -208,80 +243,112 @@ class ForNode(ASTNode):
         self.body = body
 
 class BinaryOpNode(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
         self.right = right
 
 class UnaryOpNode(ASTNode):
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator, operand):
         self.operator = operator
         self.operand = operand
 
 class CompareNode(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
         self.right = right
 
 class LogicalNode(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator  # 'and' or 'or'
         self.right = right
 
 class NumberNode(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 class StringNode(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 class BoolNode(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value  # True or False
 
 class IdentifierNode(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
 class FunctionCallNode(ASTNode):
+    __slots__ = ('name', 'arguments')
+
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
 
 class ListNode(ASTNode):
+    __slots__ = ('elements',)
+
     def __init__(self, elements):
         self.elements = elements
 
 class IndexNode(ASTNode):
+    __slots__ = ('obj', 'index')
+
     def __init__(self, obj, index):
         self.obj = obj
         self.index = index
 
 class DotAccessNode(ASTNode):
+    __slots__ = ('obj', 'field')
+
     def __init__(self, obj, field):
         self.obj = obj
         self.field = field
 
 class MethodCallNode(ASTNode):
+    __slots__ = ('obj', 'method', 'arguments')
+
     def __init__(self, obj, method, arguments):
         self.obj = obj
         self.method = method
         self.arguments = arguments
 
 class ClassNode(ASTNode):
+    __slots__ = ('name', 'body')
+
     def __init__(self, name, body):
         self.name = name
         self.body = body  # list of FunctionNode (methods)
 
 class NewNode(ASTNode):
+    __slots__ = ('class_name', 'arguments')
+
     def __init__(self, class_name, arguments):
         self.class_name = class_name
         self.arguments = arguments
 
 class TryCatchNode(ASTNode):
+    __slots__ = ('try_body', 'catch_var', 'catch_body')
+
     def __init__(self, try_body, catch_var, catch_body):
         self.try_body = try_body
         self.catch_var = catch_var
@@ -289,23 +356,31 @@ class TryCatchNode(ASTNode):
 
 class ThrowNode(ASTNode):
     """Throw an error with a message expression."""
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
 class AssertNode(ASTNode):
     """Assert that a condition is true, with optional error message."""
+    __slots__ = ('condition', 'message')
+
     def __init__(self, condition, message=None):
         self.condition = condition
         self.message = message
 
 class EnumNode(ASTNode):
     """Enum type definition with auto-incrementing integer variants."""
+    __slots__ = ('name', 'variants')
+
     def __init__(self, name, variants):
         self.name = name
         self.variants = variants
 
 class IndexedAssignmentNode(ASTNode):
     """Assignment to a list element: list[index] = value"""
+    __slots__ = ('name', 'index', 'value')
+
     def __init__(self, name, index, value):
         self.name = name
         self.index = index
@@ -313,21 +388,29 @@ class IndexedAssignmentNode(ASTNode):
 
 class DotAssignmentNode(ASTNode):
     """Assignment via dot access: obj.field = value"""
+    __slots__ = ('obj', 'field', 'value')
+
     def __init__(self, obj, field, value):
         self.obj = obj
         self.field = field
         self.value = value
 
 class AppendNode(ASTNode):
+    __slots__ = ('list_name', 'value')
+
     def __init__(self, list_name, value):
         self.list_name = list_name
         self.value = value
 
 class LenNode(ASTNode):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
 class PopNode(ASTNode):
+    __slots__ = ('list_name',)
+
     def __init__(self, list_name):
         self.list_name = list_name
 
@@ -335,16 +418,22 @@ class FStringNode(ASTNode):
     """Interpolated string: f"Hello {name}, you are {age} years old"
     parts is a list of ASTNode — StringNode for literal text, others for expressions.
     """
+    __slots__ = ('parts',)
+
     def __init__(self, parts):
         self.parts = parts  # list of ASTNode
 
 class MapNode(ASTNode):
     """Map literal: { key: value, key2: value2 }"""
+    __slots__ = ('pairs',)
+
     def __init__(self, pairs):
         self.pairs = pairs  # list of (key_expr, value_expr) tuples
 
 class ForEachNode(ASTNode):
     """For-each iteration: for item in collection"""
+    __slots__ = ('var', 'iterable', 'body')
+
     def __init__(self, var, iterable, body):
         self.var = var          # variable name
         self.iterable = iterable  # expression (list, map, or string)
@@ -352,12 +441,14 @@ class ForEachNode(ASTNode):
 
 
 class BreakNode(ASTNode):
-    pass
+    __slots__ = ()
 
 class ContinueNode(ASTNode):
-    pass
+    __slots__ = ()
 
 class TernaryNode(ASTNode):
+    __slots__ = ('condition', 'true_expr', 'false_expr')
+
     def __init__(self, condition, true_expr, false_expr):
         self.condition = condition
         self.true_expr = true_expr
@@ -368,104 +459,156 @@ class TernaryNode(ASTNode):
 # PARSER
 # ============================================================
 
+# End-of-input sentinel appended to every Parser's token list, so peek()
+# needs no bounds check.
+_EOF_TOKEN = ('EOF', None)
+
+# Parser hot-path lookup sets (frozenset for O(1) membership)
+_BLOCK_END_TOKENS = frozenset({'DEDENT', 'EOF'})
+_TERM_TOKENS = frozenset({'NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN'})
+_FUNC_CALL_ARG_TOKENS = _TERM_TOKENS | {'LBRACKET', 'KEYWORD'}
+_ATOM_KEYWORDS = frozenset({'true', 'false', 'not', 'len', 'new', 'pop', 'self'})
+_COMPARISON_OPS = frozenset({'EQ', 'NEQ', 'LT', 'GT', 'LTE', 'GTE'})
+_TYPE_KEYWORDS = frozenset({'int', 'float', 'bool', 'string'})
+
+
 class Parser:
     def __init__(self, tokens):
+        tokens = list(tokens)
+        self._end = len(tokens)
+        tokens.append(_EOF_TOKEN)
         self.tokens = tokens
+        # Parallel list of token types: most decisions look only at the
+        # type, so they index this instead of fetching and subscripting a
+        # token tuple.
+        self.token_types = [tok[0] for tok in tokens]
         self.pos = 0
+        # Statement starts dispatch on the keyword, or on the token type.
+        self._keyword_dispatch = {
+            'function': self.parse_function,
+            'class':    self.parse_class,
+            'return':   self._parse_return,
+            'print':    self._parse_print,
+            'if':       self.parse_if,
+            'while':    self.parse_while,
+            'for':      self.parse_for,
+            'break':    self._parse_break,
+            'continue': self._parse_continue,
+            'try':      self.parse_try,
+            'throw':    self.parse_throw,
+            'assert':   self.parse_assert,
+            'enum':     self.parse_enum,
+            'append':   self.parse_append,
+            'pop':      self.parse_pop,
+            'self':     self.parse_self_statement,
+        }
+        self._statement_dispatch = {
+            'IDENT':   self._parse_ident_statement,
+            'COMMENT': self._skip_token,
+            'NEWLINE': self._skip_token,
+            'INDENT':  self._skip_token,
+            'DEDENT':  self._skip_token,
+        }
+        # Atoms dispatch on the token type, and keyword atoms on the keyword.
+        self._atom_dispatch = {
+            'IDENT':    self._parse_ident_atom,
+            'NUMBER':   self._parse_number_atom,
+            'STRING':   self._parse_string_atom,
+            'FSTRING':  self._parse_fstring_atom,
+            'KEYWORD':  self._parse_keyword_atom,
+            'LPAREN':   self._parse_paren_atom,
+            'LBRACKET': self.parse_list_literal,
+            'LBRACE':   self.parse_map_literal,
+        }
+        self._atom_keyword_dispatch = {
+            'true':  self._parse_true_atom,
+            'false': self._parse_false_atom,
+            'len':   self._parse_len_atom,
+            'new':   self._parse_new_atom,
+            'pop':   self._parse_pop_atom,
+            'self':  self._parse_self_atom,
+        }
 
     def parse(self):
         statements = []
-        while self.pos < len(self.tokens):
+        while self.pos < self._end:
             self.skip_newlines()
-            if self.pos < len(self.tokens) and self.peek()[0] != 'EOF':
+            if self.peek_type() != 'EOF':
                 statement = self.parse_statement()
                 if statement:
                     statements.append(statement)
         return ProgramNode(statements)
 
     def parse_statement(self):
-        token_type, value, *_ = self.peek()
+        tok = self.peek()
+        token_type = tok[0]
+        value = tok[1]
+
+        if token_type == 'KEYWORD':
+            handler = self._keyword_dispatch.get(value)
+            if handler is not None:
+                return handler()
+            # Skip type annotations used as statements
+            if value in _TYPE_KEYWORDS:
+                self.advance()
+                return None
 
-        if token_type == 'COMMENT':
-            self.advance()
-            return None
-        elif token_type == 'KEYWORD' and value == 'function':
-            return self.parse_function()
-        elif token_type == 'KEYWORD' and value == 'class':
-            return self.parse_class()
-        elif token_type == 'KEYWORD' and value == 'return':
-            self.expect('KEYWORD', 'return')
-            expression = self.parse_full_expression()
-            return ReturnNode(expression)
-        elif token_type == 'KEYWORD' and value == 'print':
-            self.expect('KEYWORD', 'print')
+        handler = self._statement_dispatch.get(token_type)
+        if handler is not None:
+            return handler()
+        raise SyntaxError(f"Unknown statement: {token_type} {repr(value)}")
+
+    def _parse_return(self):
+        self.expect('KEYWORD', 'return')
+        expression = self.parse_full_expression()
+        return ReturnNode(expression)
+
+    def _parse_print(self):
+        self.expect('KEYWORD', 'print')
+        expression = self.parse_full_expression()
+        return PrintNode(expression)
+
+    def _parse_break(self):
+        self.expect('KEYWORD', 'break')
+        return BreakNode()
+
+    def _parse_continue(self):
+        self.expect('KEYWORD', 'continue')
+        return ContinueNode()
+
+    def _parse_ident_statement(self):
+        name = self.expect('IDENT')[1]
+        typ = self.peek_type()
+        # Check for dot access / method call
+        if typ == 'DOT':
+            return self.parse_dot_chain(IdentifierNode(name))
+        if typ == 'ASSIGN':
+            self.pos += 1
             expression = self.parse_full_expression()
-            return PrintNode(expression)
-        elif token_type == 'KEYWORD' and value == 'if':
-            return self.parse_if()
-        elif token_type == 'KEYWORD' and value == 'while':
-            return self.parse_while()
-        elif token_type == 'KEYWORD' and value == 'for':
-            return self.parse_for()
-        elif token_type == 'KEYWORD' and value == 'break':
-            self.expect('KEYWORD', 'break')
-            return BreakNode()
-        elif token_type == 'KEYWORD' and value == 'continue':
-            self.expect('KEYWORD', 'continue')
-            return ContinueNode()
-        elif token_type == 'KEYWORD' and value == 'try':
-            return self.parse_try()
-        elif token_type == 'KEYWORD' and value == 'throw':
-            return self.parse_throw()
-        elif token_type == 'KEYWORD' and value == 'assert':
-            return self.parse_assert()
-        elif token_type == 'KEYWORD' and value == 'enum':
-            return self.parse_enum()
-        elif token_type == 'KEYWORD' and value == 'append':
-            return self.parse_append()
-        elif token_type == 'KEYWORD' and value == 'pop':
-            return self.parse_pop()
-        elif token_type == 'KEYWORD' and value == 'self':
-            return self.parse_self_statement()
-        elif token_type == 'IDENT':
-            name = self.expect('IDENT')[1]
-            # Check for dot access / method call
-            if self.peek()[0] == 'DOT':
-                return self.parse_dot_chain(IdentifierNode(name))
-            if self.peek()[0] == 'ASSIGN':
+            return AssignmentNode(name, expression)
+        elif typ == 'LBRACKET':
+            # list[index] = value (indexed assignment)
+            self.pos += 1
+            idx = self.parse_full_expression()
+            self.expect('RBRACKET')
+            if self.peek_type() == 'ASSIGN':
                 self.expect('ASSIGN')
-                expression = self.parse_full_expression()
-                return AssignmentNode(name, expression)
-            elif self.peek()[0] == 'LBRACKET':
-                # list[index] = value (indexed assignment)
-                self.expect('LBRACKET')
-                idx = self.parse_full_expression()
-                self.expect('RBRACKET')
-                if self.peek()[0] == 'ASSIGN':
-                    self.expect('ASSIGN')
-                    val = self.parse_full_expression()
-                    return IndexedAssignmentNode(name, idx, val)
-                return IndexNode(IdentifierNode(name), idx)
-            else:
-                return self.parse_function_call(name)
-        elif token_type == 'NEWLINE':
-            self.advance()
-            return None
-        elif token_type in {'INDENT', 'DEDENT'}:
-            self.advance()
-            return None
-        # Skip type annotations used as statements
-        elif token_type == 'KEYWORD' and value in ('int', 'float', 'bool', 'string'):
-            self.advance()
-            return None
+                val = self.parse_full_expression()
+                return IndexedAssignmentNode(name, idx, val)
+            return IndexNode(IdentifierNode(name), idx)
         else:
-            raise SyntaxError(f"Unknown statement: {token_type} {repr(value)}")
+            return self.parse_function_call(name)
+
+    def _skip_token(self):
+        """Consume a comment, NEWLINE or stray INDENT/DEDENT; no statement results."""
+        self.advance()
+        return None
 
     def parse_function(self):
         self.expect('KEYWORD', 'function')
         name = self.expect('IDENT')[1]
         params = []
-        while self.peek()[0] == 'IDENT':
+        while self.peek_type() == 'IDENT':
             params.append(self.expect('IDENT')[1])
         self.expect('NEWLINE')
         self.expect('INDENT')
@@ -479,9 +622,9 @@ class Parser:
         self.expect('NEWLINE')
         self.expect('INDENT')
         body = []
-        while self.peek()[0] not in ('DEDENT', 'EOF'):
+        while self.peek_type() not in _BLOCK_END_TOKENS:
             self.skip_newlines()
-            if self.peek()[0] == 'DEDENT':
+            if self.peek_type() == 'DEDENT':
                 break
             stmt = self.parse_statement()
             if stmt:
@@ -499,18 +642,20 @@ class Parser:
 
         elif_chains = []
         # Handle 'else if' chains
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else if':
-            self.expect('KEYWORD', 'else if')
+        tok = self.peek()
+        while tok[0] == 'KEYWORD' and tok[1] == 'else if':
+            self.pos += 1
             elif_cond = self.parse_full_expression()
             self.expect('NEWLINE')
             self.expect('INDENT')
             elif_body = self.parse_block()
             self.expect('DEDENT')
             elif_chains.append((elif_cond, elif_body))
+            tok = self.peek()
 
         else_body = None
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else':
-            self.expect('KEYWORD', 'else')
+        if tok[0] == 'KEYWORD' and tok[1] == 'else':
+            self.pos += 1
             self.expect('NEWLINE')
             self.expect('INDENT')
             else_body = self.parse_block()
@@ -531,8 +676,9 @@ class Parser:
         self.expect('KEYWORD', 'for')
         var = self.expect('IDENT')[1]
         # Check for for-each syntax: for item in collection
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'in':
-            self.expect('KEYWORD', 'in')
+        tok = self.peek()
+        if tok[0] == 'KEYWORD' and tok[1] == 'in':
+            self.pos += 1
             iterable = self.parse_full_expression()
             self.expect('NEWLINE')
             self.expect('INDENT')
@@ -557,7 +703,7 @@ class Parser:
 
         self.expect('KEYWORD', 'catch')
         catch_var = None
-        if self.peek()[0] == 'IDENT':
+        if self.peek_type() == 'IDENT':
             catch_var = self.expect('IDENT')[1]
         self.expect('NEWLINE')
         self.expect('INDENT')
@@ -577,13 +723,12 @@ class Parser:
         self.expect('KEYWORD', 'assert')
         condition = self.parse_full_expression()
         message = None
-        if self.pos < len(self.tokens):
-            next_tok = self.peek()
-            if next_tok[0] == 'STRING':
-                message = StringNode(next_tok[1][1:-1])
-                self.advance()
-            elif next_tok[0] == 'FSTRING':
-                message = self.parse_fstring(self.advance()[1])
+        next_tok = self.peek()
+        if next_tok[0] == 'STRING':
+            message = StringNode(next_tok[1][1:-1])
+            self.advance()
+        elif next_tok[0] == 'FSTRING':
+            message = self.parse_fstring(self.advance()[1])
         return AssertNode(condition, message)
 
     def parse_enum(self):
@@ -594,10 +739,8 @@ class Parser:
         self.expect('INDENT')
 
         variants = []
-        while self.pos < len(self.tokens):
+        while True:
             self.skip_newlines()
-            if self.pos >= len(self.tokens):
-                break
             pk = self.peek()
             if pk[0] == 'DEDENT':
                 break
@@ -634,17 +777,17 @@ class Parser:
 
     def parse_dot_chain(self, obj):
         """Parse obj.field or obj.method args"""
-        while self.peek()[0] == 'DOT':
+        while self.peek_type() == 'DOT':
             self.expect('DOT')
             field = self.expect('IDENT')[1]
             # Check if it's a method call (next token is arg-like)
-            if self.peek()[0] in ('NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN', 'KEYWORD'):
+            if self.peek_type() in ('NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN', 'KEYWORD'):
                 pk = self.peek()
                 if pk[0] == 'KEYWORD' and pk[1] in ('true', 'false'):
                     args = [self.parse_term()]
-                elif pk[0] in ('NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN'):
+                elif pk[0] in _TERM_TOKENS:
                     args = []
-                    while self.peek()[0] in ('NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN'):
+                    while self.peek_type() in _TERM_TOKENS:
                         args.append(self.parse_term())
                 else:
                     args = []
@@ -655,7 +798,7 @@ class Parser:
             else:
                 obj = DotAccessNode(obj, field)
         # After dot chain, check for assignment
-        if isinstance(obj, DotAccessNode) and self.peek()[0] == 'ASSIGN':
+        if isinstance(obj, DotAccessNode) and self.peek_type() == 'ASSIGN':
             self.expect('ASSIGN')
             val = self.parse_full_expression()
             return DotAssignmentNode(obj.obj, obj.field, val)
@@ -663,29 +806,36 @@ class Parser:
 
     def parse_block(self):
         statements = []
-        while self.peek()[0] not in ('DEDENT', 'EOF'):
-            statement = self.parse_statement()
+        # Bound once: the loop runs for every statement in the block.
+        append = statements.append
+        parse_statement = self.parse_statement
+        skip_newlines = self.skip_newlines
+        types = self.token_types
+        while types[self.pos] not in _BLOCK_END_TOKENS:
+            statement = parse_statement()
             if statement:
-                statements.append(statement)
-            while self.peek()[0] == 'NEWLINE':
-                self.advance()
+                append(statement)
+            skip_newlines()
         return statements
 
     def parse_function_call(self, name):
         arguments = []
-        while self.peek()[0] in ('NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN', 'LBRACKET', 'KEYWORD'):
-            pk = self.peek()
-            if pk[0] == 'KEYWORD' and pk[1] in ('true', 'false', 'not', 'len', 'new', 'pop', 'self'):
-                arguments.append(self.parse_simple_arg())
-            elif pk[0] == 'KEYWORD':
+        append = arguments.append
+        parse_simple_arg = self.parse_simple_arg
+        tokens = self.tokens
+        types = self.token_types
+        while types[self.pos] in _FUNC_CALL_ARG_TOKENS:
+            pk = tokens[self.pos]
+            if pk[0] == 'KEYWORD' and pk[1] not in _ATOM_KEYWORDS:
                 break
-            else:
-                arguments.append(self.parse_simple_arg())
+            append(parse_simple_arg())
         return FunctionCallNode(name, arguments)
 
     def parse_simple_arg(self):
         """Parse a single function argument — no nested function calls from bare idents."""
-        token_type, value, *_ = self.peek()
+        tok = self.peek()
+        token_type = tok[0]
+        value = tok[1]
         if token_type == 'NUMBER':
             self.advance()
             return NumberNode(float(value))
@@ -725,7 +875,7 @@ class Parser:
         elif token_type == 'IDENT':
             self.advance()
             # Check for indexing
-            if self.peek()[0] == 'LBRACKET':
+            if self.peek_type() == 'LBRACKET':
                 self.expect('LBRACKET')
                 idx = self.parse_full_expression()
                 self.expect('RBRACKET')
@@ -749,11 +899,13 @@ class Parser:
 
     def parse_ternary(self):
         true_expr = self.parse_logical_or()
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'if':
-            self.advance()
+        tok = self.peek()
+        if tok[0] == 'KEYWORD' and tok[1] == 'if':
+            self.pos += 1
             condition = self.parse_logical_or()
-            if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else':
-                self.advance()
+            tok = self.peek()
+            if tok[0] == 'KEYWORD' and tok[1] == 'else':
+                self.pos += 1
                 false_expr = self.parse_ternary()
                 return TernaryNode(condition, true_expr, false_expr)
             else:
@@ -762,66 +914,84 @@ class Parser:
 
     def parse_logical_or(self):
         left = self.parse_logical_and()
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'or':
-            self.advance()
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'KEYWORD' and tokens[self.pos][1] == 'or':
+            self.pos += 1
             right = self.parse_logical_and()
             left = LogicalNode(left, 'or', right)
         return left
 
     def parse_logical_and(self):
         left = self.parse_comparison()
-        while self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'and':
-            self.advance()
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'KEYWORD' and tokens[self.pos][1] == 'and':
+            self.pos += 1
             right = self.parse_comparison()
             left = LogicalNode(left, 'and', right)
         return left
 
     def parse_comparison(self):
         left = self.parse_expression()
-        if self.peek()[0] in ('EQ', 'NEQ', 'LT', 'GT', 'LTE', 'GTE'):
-            op_type, op_val, *_ = self.advance()
+        pos = self.pos
+        if self.token_types[pos] in _COMPARISON_OPS:
+            op_val = self.tokens[pos][1]
+            self.pos = pos + 1
             right = self.parse_expression()
             return CompareNode(left, op_val, right)
         return left
 
     def parse_expression(self):
         left = self.parse_term_mul()
-        while self.peek()[0] == 'OP' and self.peek()[1] in ('+', '-'):
-            op = self.expect('OP')[1]
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'OP' and tokens[self.pos][1] in ('+', '-'):
+            op = tokens[self.pos][1]
+            self.pos += 1
             right = self.parse_term_mul()
             left = BinaryOpNode(left, op, right)
         return left
 
     def parse_term_mul(self):
         left = self.parse_unary()
-        while self.peek()[0] == 'OP' and self.peek()[1] in ('*', '/', '%'):
-            op = self.expect('OP')[1]
+        types = self.token_types
+        tokens = self.tokens
+        while types[self.pos] == 'OP' and tokens[self.pos][1] in ('*', '/', '%'):
+            op = tokens[self.pos][1]
+            self.pos += 1
             right = self.parse_unary()
             left = BinaryOpNode(left, op, right)
         return left
 
     def parse_unary(self):
-        if self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'not':
-            self.advance()
-            operand = self.parse_unary()
-            return UnaryOpNode('not', operand)
-        if self.peek()[0] == 'OP' and self.peek()[1] == '-':
-            self.advance()
-            operand = self.parse_unary()
-            return UnaryOpNode('-', operand)
+        pos = self.pos
+        token_type = self.token_types[pos]
+        if token_type == 'KEYWORD' or token_type == 'OP':
+            value = self.tokens[pos][1]
+            if value == 'not' and token_type == 'KEYWORD':
+                self.pos = pos + 1
+                operand = self.parse_unary()
+                return UnaryOpNode('not', operand)
+            if value == '-' and token_type == 'OP':
+                self.pos = pos + 1
+                operand = self.parse_unary()
+                return UnaryOpNode('-', operand)
         return self.parse_postfix()
 
     def parse_postfix(self):
         """Parse atom followed by optional [index] or .field chains."""
         node = self.parse_atom()
+        types = self.token_types
         while True:
-            if self.peek()[0] == 'LBRACKET':
-                self.expect('LBRACKET')
+            typ = types[self.pos]
+            if typ == 'LBRACKET':
+                self.pos += 1
                 idx = self.parse_full_expression()
                 self.expect('RBRACKET')
                 node = IndexNode(node, idx)
-            elif self.peek()[0] == 'DOT':
-                self.expect('DOT')
+            elif typ == 'DOT':
+                self.pos += 1
                 field = self.expect('IDENT')[1]
                 node = DotAccessNode(node, field)
             else:
@@ -829,74 +999,90 @@ class Parser:
         return node
 
     def parse_atom(self):
-        token_type, value, *_ = self.peek()
+        handler = self._atom_dispatch.get(self.token_types[self.pos])
+        if handler is None:
+            return self._unexpected_atom()
+        return handler()
 
-        if token_type == 'NUMBER':
-            self.advance()
-            return NumberNode(float(value))
-        elif token_type == 'STRING':
-            self.advance()
-            return StringNode(value[1:-1])
-        elif token_type == 'FSTRING':
-            self.advance()
-            return self.parse_fstring(value)
-        elif token_type == 'KEYWORD' and value == 'true':
-            self.advance()
-            return BoolNode(True)
-        elif token_type == 'KEYWORD' and value == 'false':
-            self.advance()
-            return BoolNode(False)
-        elif token_type == 'KEYWORD' and value == 'len':
-            self.advance()
-            arg = self.parse_atom()
-            return LenNode(arg)
-        elif token_type == 'KEYWORD' and value == 'new':
-            self.advance()
-            class_name = self.expect('IDENT')[1]
-            args = []
-            while self.peek()[0] in ('NUMBER', 'IDENT', 'STRING', 'FSTRING', 'LPAREN'):
-                args.append(self.parse_atom())
-            return NewNode(class_name, args)
-        elif token_type == 'KEYWORD' and value == 'pop':
-            self.advance()
-            list_name = self.expect('IDENT')[1]
-            return PopNode(list_name)
-        elif token_type == 'KEYWORD' and value == 'self':
-            self.advance()
-            return IdentifierNode('self')
-        elif token_type == 'LPAREN':
-            self.expect('LPAREN')
-            expr = self.parse_full_expression()
-            self.expect('RPAREN')
-            return expr
-        elif token_type == 'LBRACKET':
-            return self.parse_list_literal()
-        elif token_type == 'LBRACE':
-            return self.parse_map_literal()
-        elif token_type == 'IDENT':
-            self.advance()
-            pk = self.peek()
-            # Don't treat as function call if next is [ (that's indexing) or . (dot access)
-            if pk[0] in ('LBRACKET', 'DOT'):
-                return IdentifierNode(value)
-            # Check if function call (next is arg-like)
-            if pk[0] in ('NUMBER', 'STRING', 'FSTRING', 'LPAREN'):
-                return self.parse_function_call(value)
-            elif pk[0] == 'IDENT':
-                return self.parse_function_call(value)
-            elif pk[0] == 'KEYWORD' and pk[1] in ('true', 'false', 'not', 'len', 'new', 'pop', 'self'):
-                return self.parse_function_call(value)
-            else:
-                return IdentifierNode(value)
+    def _unexpected_atom(self):
+        token_type, value = self.peek()[:2]
+        raise SyntaxError(f'Unexpected token: {token_type} {repr(value)}')
+
+    # ── parse_atom handlers, keyed by token type in _atom_dispatch ──
+
+    def _parse_number_atom(self):
+        return NumberNode(float(self.advance()[1]))
+
+    def _parse_string_atom(self):
+        return StringNode(self.advance()[1][1:-1])
+
+    def _parse_fstring_atom(self):
+        return self.parse_fstring(self.advance()[1])
+
+    def _parse_keyword_atom(self):
+        handler = self._atom_keyword_dispatch.get(self.tokens[self.pos][1])
+        if handler is None:
+            return self._unexpected_atom()
+        return handler()
+
+    def _parse_true_atom(self):
+        self.advance()
+        return BoolNode(True)
+
+    def _parse_false_atom(self):
+        self.advance()
+        return BoolNode(False)
+
+    def _parse_len_atom(self):
+        self.advance()
+        arg = self.parse_atom()
+        return LenNode(arg)
+
+    def _parse_new_atom(self):
+        self.advance()
+        class_name = self.expect('IDENT')[1]
+        args = []
+        while self.peek_type() in _TERM_TOKENS:
+            args.append(self.parse_atom())
+        return NewNode(class_name, args)
+
+    def _parse_pop_atom(self):
+        self.advance()
+        list_name = self.expect('IDENT')[1]
+        return PopNode(list_name)
+
+    def _parse_self_atom(self):
+        self.advance()
+        return IdentifierNode('self')
+
+    def _parse_paren_atom(self):
+        self.expect('LPAREN')
+        expr = self.parse_full_expression()
+        self.expect('RPAREN')
+        return expr
+
+    def _parse_ident_atom(self):
+        value = self.advance()[1]
+        pk = self.peek()
+        # Don't treat as function call if next is [ (that's indexing) or . (dot access)
+        if pk[0] in ('LBRACKET', 'DOT'):
+            return IdentifierNode(value)
+        # Check if function call (next is arg-like)
+        if pk[0] in ('NUMBER', 'STRING', 'FSTRING', 'LPAREN'):
+            return self.parse_function_call(value)
+        elif pk[0] == 'IDENT':
+            return self.parse_function_call(value)
+        elif pk[0] == 'KEYWORD' and pk[1] in _ATOM_KEYWORDS:
+            return self.parse_function_call(value)
         else:
-            raise SyntaxError(f'Unexpected token: {token_type} {repr(value)}')
+            return IdentifierNode(value)
 
     def parse_list_literal(self):
         self.expect('LBRACKET')
         elements = []
-        while self.peek()[0] != 'RBRACKET':
+        while self.peek_type() != 'RBRACKET':
             elements.append(self.parse_full_expression())
-            if self.peek()[0] == 'COMMA':
+            if self.peek_type() == 'COMMA':
                 self.advance()
         self.expect('RBRACKET')
         return ListNode(elements)
@@ -905,12 +1091,12 @@ class Parser:
         """Parse a map literal: { key: value, key2: value2 }"""
         self.expect('LBRACE')
         pairs = []
-        while self.peek()[0] != 'RBRACE':
+        while self.peek_type() != 'RBRACE':
             key = self.parse_full_expression()
             self.expect('COLON')
             val = self.parse_full_expression()
             pairs.append((key, val))
-            if self.peek()[0] == 'COMMA':
+            if self.peek_type() == 'COMMA':
                 self.advance()
         self.expect('RBRACE')
         return MapNode(pairs)
@@ -981,11 +1167,16 @@ class Parser:
         return self.parse_atom()
 
     def skip_newlines(self):
-        while self.peek()[0] == 'NEWLINE':
-            self.advance()
+        types = self.token_types
+        while types[self.pos] == 'NEWLINE':
+            self.pos += 1
 
     def peek(self):
-        return self.tokens[self.pos] if self.pos < len(self.tokens) else ('EOF', None)
+        return self.tokens[self.pos]
+
+    def peek_type(self):
+        """Return the type of the current token ('EOF' at the end)."""
+        return self.token_types[self.pos]
 
     def advance(self):
         token = self.tokens[self.pos]
@@ -993,10 +1184,10 @@ class Parser:
         return token
 
     def expect(self, token_type, value=None):
-        actual_type, actual_value, *_ = self.advance()
-        if actual_type != token_type or (value and actual_value != value):
-            raise SyntaxError(f'Expected {token_type} {repr(value)}, got {actual_type} {repr(actual_value)}')
-        return actual_type, actual_value
+        token = self.advance()
+        if token[0] != token_type or (value and token[1] != value):
+            raise SyntaxError(f'Expected {token_type} {repr(value)}, got {token[0]} {repr(token[1])}')
+        return token
 
 
 # ============================================================
@@ -49,7 +49,7 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 
 # ── AST Utilities ────────────────────────────────────────────────────────────
@@ -64,7 +64,7 @@ def _child_attrs(node):
     if attrs is not None:
         return attrs
     attrs = tuple(
-        a for a in sorted(vars(node))
+        a for a in sorted(node_vars(node))
         if not a.startswith('_') and a != 'line_num'
     )
     _NODE_CHILD_ATTRS[cls] = attrs
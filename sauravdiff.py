@@ -21,7 +21,7 @@ import argparse
 from collections import Counter
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 
 # ── AST fingerprinting ──────────────────────────────────────────────
@@ -75,7 +75,7 @@ def _node_hash(node, _cache=None):
     parts = [_node_type(node)]
 
     # Collect scalar attributes (skip line_num — it's positional, not structural)
-    for attr in sorted(vars(node)):
+    for attr in sorted(node_vars(node)):
         if attr.startswith('_') or attr == 'line_num':
             continue
         val = getattr(node, attr)
@@ -102,7 +102,7 @@ def _node_to_dict(node, depth=0, max_depth=20):
         return repr(node)
 
     d = {"type": _node_type(node)}
-    for attr in sorted(vars(node)):
+    for attr in sorted(node_vars(node)):
         if attr.startswith('_') or attr == 'line_num':
             continue
         val = getattr(node, attr)
@@ -226,8 +226,8 @@ def _diff_attrs(old_node, new_node, _cache=None):
     so that ``_node_hash`` reuses previously computed hashes.
     """
     changes = []
-    old_attrs = set(vars(old_node).keys())
-    new_attrs = set(vars(new_node).keys())
+    old_attrs = set(node_vars(old_node).keys())
+    new_attrs = set(node_vars(new_node).keys())
 
     for attr in sorted(old_attrs | new_attrs):
         if attr.startswith('_') or attr == 'line_num':
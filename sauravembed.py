@@ -72,7 +72,7 @@ if _script_dir not in sys.path:
     sys.path.insert(0, _script_dir)
 
 from saurav import (
-    tokenize,
+    iter_tokens,
     Parser,
     Interpreter,
     FunctionCallNode,
@@ -252,8 +252,7 @@ class SauravEmbed:
 
         # Parse
         try:
-            tokens = tokenize(code)
-            parser = Parser(tokens)
+            parser = Parser(iter_tokens(code))
             ast_nodes = parser.parse()
         except Exception as e:
             elapsed = (time.perf_counter() - start) * 1000
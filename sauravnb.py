@@ -44,7 +44,7 @@ import argparse
 # Add parent directory to path for saurav imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from saurav import tokenize, Parser, Interpreter, ThrowSignal, ReturnSignal
+from saurav import iter_tokens, Parser, Interpreter, ThrowSignal, ReturnSignal
 
 # ── Cell types ───────────────────────────────────────────────
 
@@ -147,8 +147,7 @@ def execute_notebook(cells, only_cell=None):
         buf = io.StringIO()
         start = time.perf_counter()
         try:
-            tokens = list(tokenize(cell.content))
-            parser = Parser(tokens)
+            parser = Parser(iter_tokens(cell.content))
             ast_nodes = parser.parse()
 
             with contextlib.redirect_stdout(buf):
@@ -33,7 +33,7 @@ import argparse
 import string
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 KEYWORDS = {
     'if', 'else', 'while', 'for', 'in', 'function', 'return', 'print',
@@ -117,7 +117,7 @@ def _walk(node, names):
     if node_type == 'IndexedAssignmentNode':
         if hasattr(node, 'name') and isinstance(node.name, str):
             names.add(node.name)
-        for attr in vars(node):
+        for attr in node_vars(node):
             if attr.startswith('_') or attr == 'line_num':
                 continue
             _walk(getattr(node, attr), names)
@@ -137,7 +137,7 @@ def _walk(node, names):
                     names.add(p)
     if node_type == 'ImportNode':
         return
-    for attr in sorted(vars(node)):
+    for attr in sorted(node_vars(node)):
         if attr.startswith('_') or attr == 'line_num':
             continue
         val = getattr(node, attr)
@@ -54,7 +54,7 @@ if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
     sys.stdout = _io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = _io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 # ── Severity & Finding ────────────────────────────────────────────────
 
@@ -528,7 +528,7 @@ class ASTAnalyzer:
                 # FunctionCallNode with 'fun' parsed differently
                 pass
             # Walk all children
-            for attr in sorted(vars(node)):
+            for attr in sorted(node_vars(node)):
                 if attr.startswith('_') or attr == 'line_num':
                     continue
                 val = getattr(node, attr)
@@ -547,7 +547,7 @@ class ASTAnalyzer:
             if cls == "FunctionCallNode" and getattr(node, 'name', '') == func_name:
                 count += 1
             # Recurse into children
-            for attr in sorted(vars(node)):
+            for attr in sorted(node_vars(node)):
                 if attr.startswith('_') or attr == 'line_num':
                     continue
                 val = getattr(node, attr)
@@ -35,7 +35,7 @@ if sys.stdout and hasattr(sys.stdout, 'reconfigure'):
         pass
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, Interpreter, ASTNode, FunctionNode
+from saurav import tokenize, Parser, Interpreter, ASTNode, FunctionNode, node_vars
 
 
 # ── Property Types ────────────────────────────────────────────────────
@@ -99,7 +99,7 @@ def _body_contains(body, node_type_name):
     for node in body:
         if type(node).__name__ == node_type_name:
             return True
-        for attr in vars(node).values() if isinstance(node, ASTNode) else []:
+        for attr in node_vars(node).values() if isinstance(node, ASTNode) else []:
             if isinstance(attr, list):
                 if _body_contains(attr, node_type_name):
                     return True
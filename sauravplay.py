@@ -43,7 +43,7 @@ _HERE = os.path.dirname(os.path.abspath(__file__))
 if _HERE not in sys.path:
     sys.path.insert(0, _HERE)
 
-from saurav import tokenize, Parser, Interpreter, ThrowSignal, format_value  # noqa: E402
+from saurav import iter_tokens, Parser, Interpreter, ThrowSignal, format_value  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -118,8 +118,7 @@ def _run_code(source):
         nonlocal error_msg
         sys.stdout = captured
         try:
-            tokens = list(tokenize(source))
-            parser = Parser(tokens)
+            parser = Parser(iter_tokens(source))
             ast_nodes = parser.parse()
             for node in ast_nodes:
                 # Respect output limit
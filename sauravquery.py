@@ -41,13 +41,13 @@ import json as _json
 from collections import Counter
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 
 # ── AST Walking ─────────────────────────────────────────────────────
 
 # Cache which attributes of each ASTNode subclass are child-bearing.
-# Avoids calling sorted(vars(node)) on every node during tree walks,
+# Avoids calling sorted(node_vars(node)) on every node during tree walks,
 # which allocates a dict + sorted list per node.  Instead we compute
 # the attribute list once per type and reuse it for all instances.
 _NODE_CHILD_ATTRS: dict[type, tuple[str, ...]] = {}
@@ -60,7 +60,7 @@ def _child_attrs(node):
     if attrs is not None:
         return attrs
     attrs = tuple(
-        a for a in sorted(vars(node))
+        a for a in sorted(node_vars(node))
         if not a.startswith('_') and a != 'line_num'
     )
     _NODE_CHILD_ATTRS[cls] = attrs
@@ -71,7 +71,7 @@ def walk_ast(nodes, depth=0):
     """Yield (node, depth) for every ASTNode in the tree.
 
     Uses a cached per-type attribute list (via ``_child_attrs``) so we
-    avoid the ``sorted(vars(node))`` overhead on every node.  For a
+    avoid the ``sorted(node_vars(node))`` overhead on every node.  For a
     1 000-node AST this eliminates ~1 000 dict + sorted-list allocations.
     """
     if isinstance(nodes, list):
@@ -35,7 +35,7 @@ import re
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from saurav import tokenize, Parser, ASTNode
+from saurav import tokenize, Parser, ASTNode, node_vars
 
 __version__ = "1.0.0"
 
@@ -62,7 +62,7 @@ def _walk(node):
     if not isinstance(node, ASTNode):
         return
     yield node
-    for attr in vars(node).values():
+    for attr in node_vars(node).values():
         if isinstance(attr, ASTNode):
             yield from _walk(attr)
         elif isinstance(attr, list):
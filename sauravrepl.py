@@ -29,7 +29,7 @@ if _script_dir not in sys.path:
     sys.path.insert(0, _script_dir)
 
 from saurav import (
-    tokenize, Parser, Interpreter,
+    tokenize, Parser, Interpreter, ASTNode,
     FunctionCallNode, FunctionNode, AssignmentNode,
     IfNode, WhileNode, ForNode, ForEachNode, TryCatchNode,
     EnumNode, ImportNode, MatchNode, PrintNode,
@@ -572,8 +572,7 @@ class SauravRepl:
                     if hasattr(item, '__class__') and \
                        item.__class__.__module__ == 'saurav':
                         self._print_ast_node(item, indent + 1)
-            elif hasattr(child, '__class__') and \
-                 hasattr(child, '__dict__'):
+            elif isinstance(child, ASTNode):
                 self._print_ast_node(child, indent + 1)
 
     def _save_history(self):
@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from saurav import (
     tokenize,
+    iter_tokens,
     Parser,
     Interpreter,
     ReturnSignal,
@@ -51,6 +52,7 @@ from saurav import (
     ThrowSignal,
     ForEachNode,
     PopNode,
+    node_vars,
 )
 
 
@@ -181,6 +183,34 @@ class TestTokenizer:
         dedent_count = sum(1 for t in tokens if t[0] == "DEDENT")
         assert dedent_count >= 2
 
+    def test_iter_tokens_is_lazy(self):
+        stream = iter_tokens("x = 1\n@\n")
+        assert next(stream)[:2] == ("IDENT", "x")
+        with pytest.raises(RuntimeError, match="Unexpected character"):
+            list(stream)
+
+    def test_iter_tokens_matches_tokenize(self):
+        code = "if x\n    y = 1\nelse if z\n    y = 2\nelse\n    y = 3\n"
+        assert list(iter_tokens(code)) == tokenize(code)
+
+    def test_else_if_merged(self):
+        values = [t[1] for t in tokenize("else if x\nelse\nif y\nelse") if t[0] == "KEYWORD"]
+        assert values == ["else if", "else", "if", "else"]
+
+    def test_tab_indent_counts_as_four_spaces(self):
+        tokens = tokenize("if x\n\t y = 1\n")
+        assert [t[1] for t in tokens if t[0] == "INDENT"] == [5]
+
+    def test_whitespace_runs_keep_columns(self):
+        tokens = tokenize("x \t = 1   \n")
+        assert [(t[0], t[1], t[3]) for t in tokens] == [
+            ("IDENT", "x", 0), ("ASSIGN", "=", 4), ("NUMBER", "1", 6), ("NEWLINE", "\n", 10),
+        ]
+
+    def test_identifier_values_are_shared(self):
+        names = [t[1] for t in tokenize("count = count + 1\n") if t[0] == "IDENT"]
+        assert names == ["count", "count"] and names[0] is names[1]
+
 
 # ============================================================
 # Parser Tests
@@ -195,6 +225,26 @@ class TestParser:
         assert len(assignments) == 1
         assert assignments[0].name == "x"
 
+    def test_parse_from_token_stream(self):
+        parser = Parser(iter_tokens("x = 42\n"))
+        assert parser.token_types == [t[0] for t in parser.tokens]
+        ast = parser.parse()
+        assert isinstance(ast[0], AssignmentNode)
+        assert ast[0].name == "x"
+
+    def test_token_list_ends_with_eof_sentinel(self):
+        tokens = tokenize("x = 1")
+        parser = Parser(tokens)
+        assert parser.peek_type() == "IDENT"
+        assert parser.tokens[-1][0] == "EOF"
+        assert tokens[-1][0] != "EOF"  # the caller's list is left alone
+        parser.parse()
+        assert parser.peek_type() == "EOF"
+
+    def test_truncated_block_header_is_syntax_error(self):
+        with pytest.raises(SyntaxError, match="got EOF"):
+            Parser(tokenize("if x")).parse()
+
     def test_parse_print(self):
         tokens = list(tokenize('print "hello"\n'))
         parser = Parser(tokens)
@@ -268,6 +318,45 @@ class TestParser:
         with pytest.raises(SyntaxError):
             parser.parse()
 
+    def test_ast_nodes_use_slots(self):
+        ast = Parser(list(tokenize("x = 3 + 4\n"))).parse()
+        assign = ast[0]
+        assert not hasattr(assign, '__dict__')
+        assert not hasattr(assign.expression, '__dict__')
+        assert assign.line_num == 1
+        assert BinaryOpNode(NumberNode(1), '+', NumberNode(2)).line_num is None
+
+    def test_node_vars_reports_set_fields(self):
+        func = Parser(list(tokenize("function f x\n    return x\n"))).parse()[0]
+        fields = node_vars(func)
+        assert fields['name'] == 'f'
+        assert fields['params'] == ['x']
+        # Optional slots that were never assigned are left out, like vars().
+        assert 'closure_scope' not in fields
+        func.closure_scope = {}
+        assert node_vars(func)['closure_scope'] == {}
+
+    def test_binary_op_resolves_numeric_operator(self):
+        node = BinaryOpNode(NumberNode(7), '%', NumberNode(3))
+        assert node._numeric_op(7, 3) == 1
+        assert node_vars(node)['operator'] == '%'
+
+    def test_binary_op_resolves_generic_operator(self):
+        node = BinaryOpNode(StringNode("a"), '+', StringNode("b"))
+        assert node._generic_op("a", "b") == "ab"
+        assert BinaryOpNode(NumberNode(2), '*', NumberNode(3))._generic_op is None
+
+    def test_compare_resolves_operator(self):
+        node = CompareNode(NumberNode(2), '<=', NumberNode(3))
+        assert node._compare_op(2, 3) is True
+        assert node_vars(node)['operator'] == '<='
+
+    def test_call_collects_literal_arguments(self):
+        node = Parser(list(tokenize('f 30 "a" true\n'))).parse()[0]
+        assert node._const_args == (30, "a", True)
+        node = Parser(list(tokenize('f 30 x\n'))).parse()[0]
+        assert node._const_args is None
+
 
 # ============================================================
 # Interpreter Tests — Arithmetic
@@ -357,6 +446,12 @@ class TestVariables:
         with pytest.raises(RuntimeError, match="not defined"):
             run_code("print z\n")
 
+    def test_function_reads_locals_before_globals(self):
+        code = ('x = "global"\ny = "outer"\n'
+                'function show x\n    return x + " " + y\n'
+                'print show "local"\n')
+        assert run_code(code).strip() == "local outer"
+
 
 # ============================================================
 # Interpreter Tests — Functions
@@ -418,6 +513,31 @@ print fib 10
         output = run_code(code)
         assert output.strip() == "55"
 
+    def test_tail_recursion_runs_past_depth_limit(self):
+        code = """function count n acc
+    if n == 0
+        return acc
+    return count (n - 1) (acc + n)
+
+print count 5000 0
+"""
+        output = run_code(code)
+        assert output.strip() == "12502500"
+
+    def test_tail_call_to_redefined_name(self):
+        """The callee is looked up when reached, so a redefinition is honoured."""
+        code = """function step n
+    if n > 2
+        return n
+    function step n
+        return n * 100
+    return step (n + 1)
+
+print step 1
+"""
+        output = run_code(code)
+        assert output.strip() == "200"
+
     def test_function_scope_isolation(self):
         """Function vars shouldn't leak to outer scope."""
         code = """x = 100
@@ -431,6 +551,240 @@ print x
         output = run_code(code)
         assert output.strip() == "100"
 
+    def test_nested_call_scopes_stay_flat(self):
+        """Each call layers one map over its caller's maps, not a nested ChainMap."""
+        code = """g = 7
+function down n
+    if n == 0
+        return depth
+    depth = n
+    return down (n - 1) + g
+"""
+        interp = Interpreter()
+        for node in Parser(tokenize(code)).parse():
+            interp.interpret(node)
+        seen = []
+        real_evaluate = interp.evaluate
+
+        def spy(node):
+            seen.append(interp.variables)
+            return real_evaluate(node)
+
+        interp.evaluate = spy
+        assert interp.execute_function(FunctionCallNode("down", [NumberNode(3)])) == 22
+        assert all(type(m) is dict for scope in seen if hasattr(scope, "maps")
+                   for m in scope.maps)
+
+
+class TestNumericKernels:
+    """Pure arithmetic functions run as compiled kernels."""
+
+    HYP = """function hyp2 a b
+    sa = a * a
+    if sa > 100
+        return -1
+    return sa + b * b
+"""
+
+    def _interp(self, code):
+        interp = Interpreter()
+        with redirect_stdout(io.StringIO()) as buf:
+            for node in Parser(list(tokenize(code))).parse():
+                interp.interpret(node)
+        return interp, buf.getvalue()
+
+    def test_pure_function_is_compiled(self):
+        interp, output = self._interp(self.HYP + "print hyp2 3 4\nprint hyp2 11 1\n")
+        assert output.split() == ["25", "-1"]
+        assert interp.functions["hyp2"]._kernel
+
+    def test_impure_function_is_not_compiled(self):
+        code = "g = 2\nfunction f x\n    return x * g\nprint f 4\n"
+        interp, output = self._interp(code)
+        assert output.strip() == "8"
+        assert interp.functions["f"]._kernel is False
+
+    def test_non_numeric_arguments_fall_back(self):
+        code = 'function add a b\n    return a + b\nprint add "ab" "cd"\n'
+        assert run_code(code).strip() == "abcd"
+
+    def test_kernel_errors_keep_line_numbers(self):
+        code = "function div a b\n    return a / b\nprint div 1 0\n"
+        with pytest.raises(RuntimeError, match="Division by zero") as exc:
+            run_code(code)
+        assert exc.value.line == 2
+
+    def test_kernel_modulo_by_zero_falls_back(self):
+        code = "function wrap a b\n    return a % b + 1\nprint wrap 7 3\nprint wrap 7 0\n"
+        with pytest.raises(RuntimeError, match="Modulo by zero"):
+            run_code(code)
+        interp, output = self._interp("function wrap a b\n    return a % b + 1\nprint wrap 7 3\n")
+        assert output.strip() == "2"
+        assert interp.functions["wrap"]._kernel
+
+    def test_kernel_calls_math_builtins(self):
+        code = "function dist x y\n    return sqrt (x * x + y * y)\nprint dist 3 4\n"
+        interp, output = self._interp(code)
+        assert output.strip() == "5"
+        assert interp.functions["dist"]._kernel.builtins == ("sqrt",)
+
+    def test_kernel_calls_other_kernels(self):
+        code = ("function sq x\n    return x * x\n"
+                "function norm2 a b\n    return (sq a) + (sq b)\n"
+                "print norm2 3 4\n")
+        interp, output = self._interp(code)
+        assert output.strip() == "25"
+        assert interp.functions["norm2"]._kernel.builtins == ()
+
+    def test_callee_without_kernel_keeps_caller_tree_walked(self):
+        code = ("function loud x\n    print x\n    return x\n"
+                "function twice x\n    return (loud x) * 2\n"
+                "print twice 4\n")
+        interp, output = self._interp(code)
+        assert output.split() == ["4", "8"]
+        assert interp.functions["twice"]._kernel is False
+
+    def test_redefined_callee_falls_back(self):
+        code = ("function step x\n    return x + 1\n"
+                "function twice x\n    return (step x) * 2\n"
+                "print twice 1\n"
+                "function step x\n    print \"called\"\n    return x\n"
+                "print twice 1\n")
+        assert run_code(code).split() == ["4", "called", "2"]
+
+    def test_recursive_function_is_not_compiled(self):
+        code = ("function fib n\n    if n < 2\n        return n\n"
+                "    return (fib (n - 1)) + (fib (n - 2))\n"
+                "print fib 20\n")
+        interp, output = self._interp(code)
+        assert output.strip() == "6765"
+        assert interp.functions["fib"]._kernel is False
+        assert interp.functions["fib"]._memo
+
+    def test_user_function_shadows_kernel_builtin(self):
+        code = ("function twice x\n    return abs x * 2\n"
+                "function abs x\n    return 100\n"
+                "print twice 3\n")
+        assert run_code(code).strip() == "200"
+
+    def test_hooked_interpreter_bypasses_kernels(self):
+        seen = []
+
+        class Tracing(Interpreter):
+            def interpret(self, ast):
+                seen.append(type(ast).__name__)
+                return super().interpret(ast)
+
+        interp = Tracing()
+        with redirect_stdout(io.StringIO()):
+            for node in Parser(list(tokenize(self.HYP + "print hyp2 3 4\n"))).parse():
+                interp.interpret(node)
+        assert "ReturnNode" in seen
+
+    def test_arithmetic_expression_is_compiled(self):
+        interp, output = self._interp("a = 3\nb = 4.5\nx = a * a + b - 1\nprint x\n")
+        assert output.strip() == "12.5"
+        expr = Parser(list(tokenize("x = a * a + b - 1\n"))).parse()[0].expression
+        interp.evaluate(expr)
+        assert expr._kernel.names == ("a", "b")
+
+    def test_small_or_mixed_expression_is_not_compiled(self):
+        for code in ("x = a + 1\n", "x = a + len b * 2\n"):
+            expr = Parser(list(tokenize(code))).parse()[0].expression
+            interp, _ = self._interp('a = 1\nb = "xy"\n')
+            interp.evaluate(expr)
+            assert expr._kernel is False
+
+    def test_condition_is_compiled(self):
+        code = "i = 2\nn = 9\nx = i * 2 < n and not (i == 0)\nprint x\n"
+        interp, output = self._interp(code)
+        assert output.strip() == "true"
+        expr = Parser(list(tokenize("x = i * 2 < n and not (i == 0)\n"))).parse()[0].expression
+        assert interp.evaluate(expr) is True
+        assert expr._kernel.names == ("i", "n")
+        assert run_code('i = "a"\nprint i == "a" or i < 0\n').strip() == "true"
+
+    def test_literal_list_is_copied_from_cache(self):
+        code = ("function fresh n\n    xs = [1, 2, \"a\", true]\n    append xs n\n    return len xs\n"
+                "print fresh 1\nprint fresh 2\n")
+        assert run_code(code).split() == ["5", "5"]
+        node = Parser(list(tokenize("x = [1, 2, 3, 4]\n"))).parse()[0].expression
+        interp, _ = self._interp("")
+        assert interp.evaluate(node) == [1, 2, 3, 4]
+        assert node._values == [1, 2, 3, 4]
+
+    def test_literal_arithmetic_is_folded(self):
+        expr = Parser(list(tokenize("x = 24 * 60 / 2\n"))).parse()[0].expression
+        interp, _ = self._interp("")
+        assert interp.evaluate(expr) == 720
+        assert expr._kernel.names == () and expr._kernel.fn() == 720
+        with pytest.raises(RuntimeError, match="Division by zero"):
+            run_code("print 2 * 1 / 0\n")
+
+    def test_expression_kernel_falls_back(self):
+        assert run_code('a = "ab"\nb = 2\nprint a * b + "c"\n').strip() == "ababc"
+        with pytest.raises(RuntimeError, match="Modulo by zero"):
+            run_code("a = 5\nb = 0\nprint a + a % b\n")
+
+    def test_numeric_for_loop_is_compiled(self):
+        code = ("total = 0\nfor i 0 10\n    sq = i * i\n    if sq > 50\n        break\n"
+                "    total = total + sq\nprint total\nprint sq\nprint i\n")
+        interp, output = self._interp(code)
+        assert output.split() == ["140", "64", "8"]
+        loop = Parser(list(tokenize(code))).parse()[1]
+        interp.interpret(loop)
+        assert loop._kernel.inputs == ("total",)
+
+    def test_for_loop_kernel_falls_back(self):
+        assert run_code('s = "a"\nfor i 0 3\n    s = s + s\nprint s\n').strip() == "aaaaaaaa"
+        with pytest.raises(RuntimeError, match="Division by zero"):
+            run_code("x = 1\nfor i 0 5\n    x = x / (i - 3)\n")
+
+    def test_function_with_for_loop_is_compiled(self):
+        code = "function tri n\n    t = 0\n    for i 1 (n + 1)\n        t = t + i\n    return t\nprint tri 4\n"
+        interp, output = self._interp(code)
+        assert output.strip() == "10"
+        assert interp.functions["tri"]._kernel
+
+    FIB = """function fib n
+    if n < 2
+        return n
+    return fib (n - 1) + fib (n - 2)
+"""
+
+    def test_pure_recursive_function_is_memoized(self):
+        interp, output = self._interp(self.FIB + "print fib 60\n")
+        assert output.strip() == "1548008755920"
+        assert len(interp.functions["fib"]._memo.results) == 61
+
+    def test_memo_keys_keep_argument_types(self):
+        interp, _ = self._interp(self.FIB + "x = fib 10\n")
+        keys = interp.functions["fib"]._memo.results
+        assert (float, 1.0) in keys and (int, 1) not in keys
+
+    def test_recursive_function_with_loop_is_memoized(self):
+        code = ("function ways n\n    if n == 0\n        return 1\n    t = 0\n"
+                "    for k 1 (n + 1)\n        t = t + ways (n - k)\n    return t\n"
+                "print ways 40\n")
+        interp, output = self._interp(code)
+        assert output.strip() == "549755813888"
+        assert len(interp.functions["ways"]._memo.results) == 41
+
+    def test_full_memo_drops_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr("saurav._MEMO_MAX_ENTRIES", 4)
+        interp, output = self._interp(self.FIB + "print fib 30\n")
+        assert output.strip() == "832040"
+        keys = list(interp.functions["fib"]._memo.results)
+        # fib 30 reused fib 28 after fib 29 was stored, so 28 moved up.
+        assert keys == [(float, v) for v in (27.0, 29.0, 28.0, 30.0)]
+
+    def test_impure_recursive_function_is_not_memoized(self):
+        code = ("g = 1\nfunction f n\n    if n < 1\n        return g\n"
+                "    return f (n - 1)\nprint f 2\ng = 5\nprint f 2\n")
+        interp, output = self._interp(code)
+        assert output.split() == ["1", "5"]
+        assert interp.functions["f"]._memo is False
+
 
 # ============================================================
 # Interpreter Tests — Control Flow
@@ -768,6 +1122,10 @@ class TestTruthiness:
         output = run_code('if "x"\n    print 1\n')
         assert output.strip() == "1"
 
+    def test_logical_operators_return_bools(self):
+        output = run_code('print 2 and "x"\nprint 0 or []\nprint not ""\nprint 1 < 2 and 3\n')
+        assert output.split() == ["true", "false", "true", "true"]
+
 
 # ============================================================
 # Interpreter Tests — Edge Cases & Error Handling
@@ -1575,6 +1933,14 @@ class TestFStringParser:
         assert isinstance(fstr, FStringNode)
         assert len(fstr.parts) == 2  # "Hello " + name expression
 
+    def test_parse_fstring_bare_names(self):
+        """Bare names skip re-tokenizing but build the same nodes."""
+        ast = Parser(list(tokenize('x = f"{ name }{pi}{true}"\n'))).parse()
+        name, pi, flag = ast[0].expression.parts
+        assert isinstance(name, IdentifierNode) and name.name == "name"
+        assert isinstance(pi, FunctionCallNode) and pi.arguments == []
+        assert isinstance(flag, BoolNode)
+
     def test_parse_fstring_repr(self):
         node = FStringNode([StringNode("hello")])
         assert "FStringNode" in repr(node)
@@ -3030,6 +3396,18 @@ class TestLambdaClosure:
         )
         assert output.strip() == "[11, 12, 13]"
 
+    def test_lambda_inside_function_shadows_global(self):
+        """A local binding wins over a global of the same name in the closure."""
+        output = run_code(
+            'n = 1\n'
+            'function make n\n'
+            '    return lambda x -> x + n\n'
+            '\n'
+            'f = make 100\n'
+            'print f 5\n'
+        )
+        assert output.strip() == "105"
+
 
 class TestLambdaTypeOf:
     """Test type_of and to_string with lambda values."""
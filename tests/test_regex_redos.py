@@ -197,3 +197,16 @@ class TestRegexReDoSProtection:
         """(.*)+  is dangerous — rejected."""
         with pytest.raises(RuntimeError, match="nested quantifiers"):
             run_code('print regex_match "(.*)+" "abc"\n')
+
+    def test_validated_pattern_is_compiled_once(self):
+        """A pattern that passed validation is reused, compiled."""
+        interp = Interpreter()
+        first = interp._regex_validate('regex_match', "^x+y$")
+        assert interp._regex_validate('regex_find', "^x+y$") is first
+        assert first.pattern == "^x+y$"
+
+    def test_rejected_pattern_is_not_cached(self):
+        """A rejected pattern is rejected again on every call."""
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="nested quantifiers"):
+                run_code('print regex_match "(b+)+" "bbb"\n')
@@ -88,6 +88,17 @@ class TestTokenizer:
         strings = [t for t in tokens if t[0] == "STRING"]
         assert len(strings) == 1
 
+    def test_else_if_is_one_token(self):
+        tokens = tokenize("else if x\nelse\nif y\n")
+        keywords = [(t[1], t[2], t[3]) for t in tokens if t[0] == "KEYWORD"]
+        assert keywords == [("else if", 1, 0), ("else", 2, 0), ("if", 3, 0)]
+
+    def test_keywords_and_types_are_interned(self):
+        tokens = tokenize("while true\n    x = 1\n")
+        assert tokens[0][0] is sys.intern("KEYWORD")
+        assert tokens[0][1] is sys.intern("while")
+        assert tokens[2][0] is sys.intern("NEWLINE")
+
 
 # ── Parser tests ─────────────────────────────────────────────
 
@@ -148,6 +159,19 @@ class TestParser:
         ast = self._parse(code)
         assert len(ast.statements) >= 1
 
+    def test_token_list_ends_with_eof_sentinel(self):
+        parser = Parser(tokenize("x = 1\n"))
+        assert parser.tokens[-1][0] == "EOF"
+
+    def test_truncated_input_is_syntax_error(self):
+        with pytest.raises(SyntaxError):
+            self._parse("function")
+
+    def test_nodes_use_slots(self):
+        stmt = self._parse("x = 1 + 2").statements[0]
+        assert not hasattr(stmt, "__dict__")
+        assert [type(c).__name__ for c in stmt.expression.children()] == ["NumberNode", "NumberNode"]
+
 
 # ── Code Generator tests ────────────────────────────────────
 
@@ -269,6 +269,14 @@ class TestReplCommands(unittest.TestCase):
             output = mock_out.getvalue()
             self.assertIn("Assignment", output)
 
+    def test_ast_command_shows_child_nodes(self):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.repl._handle_command(".ast x = 1 + 2 * y")
+            output = mock_out.getvalue()
+            # Only the IdentifierNode's own line prints name='y'; the
+            # parent's expression repr shows it as name=y.
+            self.assertIn("name='y'", output)
+
     def test_ast_no_arg(self):
         with patch("sys.stdout", new_callable=io.StringIO) as mock_out:
             self.repl._handle_command(".ast")